@@ -0,0 +1,191 @@
+"""
+SuperLib Ultimate Complete - 全功能整合版
+
+功能模块：
+    1. 随机数生成（基于线性同余算法）
+    2. 长度检测（内置 len）
+    3. 数学运算（加、减、乘、除、幂、平方根、阶乘、正弦、余弦，正弦余弦使用泰勒级数展开）
+    4. 字符串相似度比较（Levenshtein 编辑距离及相似度比率）
+    5. 多种排序算法：
+         - 冒泡排序、快速排序、插入排序、选择排序、归并排序、
+           堆排序、希尔排序、计数排序、基数排序、侏儒排序、梳排序
+         - **新增：交换算法（列表逆序）**
+    6. 彩色输出（利用 ANSI 转义码实现彩色文本）
+    7. 系统信息获取：
+         - HWID（基于当前工作目录、平台和 Python 版本生成简易标识）
+         - Cookies（模拟返回固定字符串）
+    8. 延迟函数（睡眠 + 校准后的短暂忙等）
+    9. CMD 命令行界面：通过菜单测试各项功能
+    10. **新增扩展功能**：
+         - \nt 为换行并空格
+         - %winver 为读取 Windows 版本
+         - %verx 为读取 Windows 版本位数
+         - %getc: 读取指定盘符（如 C:）的剩余空间（单位 G）
+         - %getfps: 读取 FPS 帧率
+         - printf("") 更好的输出函数（会自动替换上述标记）
+         - **新增宏支持：使用 "$" 开头的宏进行替换，可通过 define_macro 定义自定义宏**
+         
+新增扩展功能部分允许调用内置模块 re、platform 与 ctypes（均在首次使用时才导入）。
+
+包结构（子模块在首次访问其中的名称时才导入，import PyFunLibs 本身几乎不做任何工作）：
+    PyFunLibs.sorting   排序算法、堆与优先队列、并行/外部排序、排序基准
+    PyFunLibs.math      Calculator 数学运算
+    PyFunLibs.strings   长度检测与字符串相似度
+    PyFunLibs.random    随机数生成器与可插拔后端
+    PyFunLibs.io        彩色输出、缓冲输出、printf 与异步控制台
+    PyFunLibs.system    系统信息、探测注册表与延迟函数
+    PyFunLibs.cli       交互式菜单、基准测试与批处理命令行（python -m PyFunLibs）
+"""
+#==============================================================================================#
+'''English'''
+'''SuperLib Ultimate Complete – Main Features
+
+Random Number Generation
+
+Uses a Linear Congruential Generator (LCG) to produce pseudo-random numbers.
+
+Provides functions to generate a random float between 0 and 1 and random integers within a specified range.
+
+Length Check
+
+Offers a simple function to check the length of strings, lists, or any object using Python’s built-in len function.
+
+Mathematical Operations
+
+Basic arithmetic: addition, subtraction, multiplication, and division.
+
+Advanced operations: exponentiation, square root, factorial, sine, and cosine (the latter two implemented with Taylor series approximations).
+
+String Similarity Comparison
+
+Implements the Levenshtein distance algorithm to compare two strings.
+
+Provides a similarity ratio function based on the edit distance.
+
+Sorting Algorithms
+
+Contains various sorting methods including:
+
+Bubble Sort, Quick Sort, Insertion Sort, Selection Sort, Merge Sort, Heap Sort, Shell Sort, Counting Sort, Radix Sort, Gnome Sort, and Comb Sort.
+
+Additional “Swap” Algorithm: A reverse (swap) function that reverses the order of elements in a list (e.g., turns [1,2,3,4,5,6,7] into [7,6,5,4,3,2,1]).
+
+Colorful Output
+
+Uses ANSI escape codes to display colored text in the terminal.
+
+System Information Retrieval
+
+Provides a method to generate a simple HWID based on the current working directory, platform, and Python version.
+
+Simulates cookie retrieval by returning a fixed string.
+
+Delay Function
+
+Implements a precise delay that sleeps for most of the interval and busy-waits only for a short, self-calibrating final window, with asyncio variants.
+
+Command-Line Interface (CMD)
+
+Offers an interactive menu to test and demonstrate all the library’s functionalities.
+
+Extended Features with Special Markers
+
+Supports special markers in strings for dynamic content replacement:
+
+\nt converts to a newline followed by a space.
+
+%winver is replaced with the Windows version.
+
+%verx is replaced with the Windows architecture (32-bit or 64-bit).
+
+%getc: followed by a drive letter (e.g., %getc:C:) returns the free disk space (in gigabytes) of that drive.
+
+%getfps: is replaced with a placeholder FPS value (e.g., 60).
+
+An enhanced printf() function processes these markers before printing.
+
+Macro Support
+
+Allows the definition of macros that start with the $ symbol.
+
+Built-in macros (like $winver, $verx, $getfps, etc.) are available, and users can define custom macros using the define_macro() function.
+
+These macros are automatically replaced in strings processed by the enhanced printf().
+
+English Translation of the Library's Content:
+
+SuperLib Ultimate Complete is an extensive and self-contained library implemented in Python that provides a wide range of functionalities without relying on external packages (except for a few built-in modules such as sys, os, re, platform, and ctypes). The library includes:
+
+Random Number Generation:
+Using a Linear Congruential Generator, it can produce both floating-point numbers (between 0 and 1) and integers within a specified range.
+
+Length Checking:
+A simple function is available to determine the length of any object that supports the len function.
+
+Mathematical Operations:
+The library supports basic arithmetic operations as well as advanced calculations like exponentiation, square roots, factorials, and trigonometric functions (sine and cosine, calculated using Taylor series).
+
+String Similarity:
+It features an implementation of the Levenshtein distance algorithm to measure how similar two strings are, and computes a similarity ratio based on this distance.
+
+Sorting Algorithms:
+Multiple sorting techniques are implemented, including Bubble, Quick, Insertion, Selection, Merge, Heap, Shell, Counting, Radix, Gnome, and Comb Sorts. In addition, a reverse (swap) algorithm is provided to reverse the order of elements in a list.
+
+Colorful Terminal Output:
+ANSI escape codes are used to produce colored text output for enhanced terminal display.
+
+System Information:
+The library can generate a simple hardware ID (HWID) from the current directory, operating system, and Python version, and simulates retrieving cookies by returning a preset string.
+
+Delay Function:
+A hybrid delay function sleeps first and spins only for the last moment, giving precise timing without keeping the CPU busy.
+
+Command-Line Interface (CMD):
+An interactive menu allows users to test and experience each of the library's functions.
+
+Extended Features and Macro Support:
+The library can replace special markers within strings (e.g., markers for newline with space, Windows version, system architecture, disk free space, FPS value) through an enhanced printf() function. It also supports user-defined macros that begin with the $ character, allowing dynamic text substitution within output strings.
+
+This comprehensive library is ideal for educational purposes and demonstrations, offering a variety of algorithms and techniques all contained within a single, self-sufficient Python module.'''
+
+# =======================
+# 按需加载子模块
+# =======================
+# 公开名称 -> 定义它的子模块；from PyFunLibs import printf 只会导入 PyFunLibs.io 及其依赖
+_LAZY = {}
+for _module, _names in (
+    ("sorting", ("Sorter", "BinaryHeap", "PriorityQueue", "ExternalSorter", "SORT_DISTRIBUTIONS",
+                 "SORT_ALGORITHMS", "make_distribution", "benchmark_sorter")),
+    ("math", ("Calculator", "benchmark_trig")),
+    ("strings", ("check_length", "levenshtein_distance", "similarity_ratio", "FuzzyIndex",
+                 "similarity_pairs", "dedup_clusters")),
+    ("random", ("RandomGenerator", "SplitMix64Generator", "Xoshiro256Generator", "PCG64Generator",
+                "WeightedSampler", "RNG_BACKENDS", "benchmark_rng")),
+    ("io", ("ColorOutput", "Colorizer", "OutputSink", "output_sink", "buffered_output", "output",
+            "user_input", "FormatTemplate", "compile_format", "printf", "define_macro", "AsyncConsole",
+            "async_user_input", "async_output", "async_printf")),
+    ("system", ("SystemInfo", "calibrate_delay", "delay_until", "delay", "async_delay_until",
+                "async_delay", "get_winver", "get_verx", "getc", "get_fps", "ProbeRegistry",
+                "system_probes", "register_probe")),
+    ("cli", ("cmd_sorting", "main_menu", "async_main_menu", "bench_main", "benchmark_import", "cli_main")),
+):
+    for _name in _names:
+        _LAZY[_name] = _module
+del _module, _names, _name
+
+__all__ = sorted(_LAZY)
+
+def __getattr__(name):
+    """
+    首次访问 PyFunLibs.<名称> 时导入对应子模块，并把结果写回包的命名空间，之后的访问不再经过这里
+    """
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module("." + module, __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,15 @@
+"""
+python -m PyFunLibs [async | sort | similarity | printf | math | bench ...]
+"""
+import sys
+
+from .cli import _CLI_COMMANDS, cli_main, main_menu
+
+if len(sys.argv) > 1 and sys.argv[1] == "async":
+    import asyncio
+    from .cli import async_main_menu
+    asyncio.run(async_main_menu())
+    sys.exit(0)
+if len(sys.argv) > 1 and sys.argv[1] in _CLI_COMMANDS + ("-h", "--help"):
+    sys.exit(cli_main(sys.argv[1:]))
+main_menu()
@@ -0,0 +1,775 @@
+"""
+命令行：交互式菜单（同步与 asyncio 版本）、基准测试入口与非交互批处理子命令
+"""
+import os
+import sys
+import time
+from array import array
+
+from .io import ColorOutput, AsyncConsole, output, user_input, printf, define_macro, buffered_output
+from .math import Calculator, _ERROR_POLICIES, benchmark_trig
+from .random import RandomGenerator, benchmark_rng
+from .sorting import Sorter, ExternalSorter, SORT_ALGORITHMS, SORT_DISTRIBUTIONS, benchmark_sorter
+from .strings import check_length, levenshtein_distance, similarity_ratio, similarity_pairs, _chunked
+from .system import SystemInfo, delay, async_delay
+
+# =======================
+# CMD 命令行界面 - 排序测试
+# =======================
+_SORTING_MENU = {
+    '1': ('冒泡排序', Sorter.bubble),
+    '2': ('快速排序', Sorter.quick),
+    '3': ('插入排序', Sorter.insertion),
+    '4': ('选择排序', Sorter.selection),
+    '5': ('归并排序', Sorter.merge),
+    '6': ('堆排序', Sorter.heap),
+    '7': ('希尔排序', Sorter.shell),
+    '8': ('计数排序', Sorter.counting),
+    '9': ('基数排序', Sorter.radix),
+    '10': ('侏儒排序', Sorter.gnome),
+    '11': ('梳排序', Sorter.comb),
+    '12': ('交换算法(列表逆序)', Sorter.reverse),
+    '13': ('自动选择(auto)', Sorter.auto)
+}
+_QUADRATIC_CHOICES = {'1', '3', '4', '10'}
+
+def cmd_sorting():
+    output("欢迎进入排序命令行界面！")
+    sorting_methods = _SORTING_MENU
+    quadratic = _QUADRATIC_CHOICES
+    output("请选择排序算法：")
+    for key in sorted(sorting_methods.keys(), key=lambda x: int(x)):
+        output(f"{key}. {sorting_methods[key][0]}")
+    choice = user_input("请输入选项编号：")
+    if choice not in sorting_methods:
+        output("无效选择，退出排序命令行。")
+        return
+    method_name, method_func = sorting_methods[choice]
+    output(f"你选择了：{method_name}")
+    arr_str = user_input("请输入一组数字（以空格分隔）：")
+    try:
+        arr = [int(x) for x in arr_str.split()]
+    except:
+        output("输入格式错误，必须为数字。")
+        return
+    if choice in quadratic and len(arr) > 5000:
+        output("提示：该算法为 O(n²)，数据量较大时建议选择 13. 自动选择(auto)")
+    sorted_arr = method_func(arr)
+    output("排序前数组：" + str(arr))
+    output("排序后数组：" + str(sorted_arr))
+
+# =======================
+# 主 CMD 菜单
+# =======================
+_MENU_LINES = (
+    "\n=== SuperLib Ultimate CMD ===",
+    "1. 数学运算测试",
+    "2. 随机数生成测试",
+    "3. 字符串长度检测",
+    "4. 相似度比较测试",
+    "5. 排序算法测试 (CMD)",
+    "6. 彩色输出测试",
+    "7. 系统信息测试 (HWID & Cookies)",
+    "8. 延迟函数测试",
+    "9. printf 测试 (新扩展功能)",
+    "10. 定义新宏 (例如: $name)",
+    "11. 退出",
+)
+
+def _math_report(a, b):
+    """
+    菜单“数学运算测试”的全部结果行（同步与异步菜单共用，异步菜单在执行器中调用）
+    """
+    lines = [f"a + b = {Calculator.add(a, b)}",
+             f"a - b = {Calculator.subtract(a, b)}",
+             f"a * b = {Calculator.multiply(a, b)}"]
+    try:
+        lines.append(f"a / b = {Calculator.divide(a, b)}")
+    except Exception as e:
+        lines.append("错误: " + str(e))
+    try:
+        lines.append(f"a^b = {Calculator.power(a, b)}")
+    except Exception as e:
+        lines.append("错误: " + str(e))
+    lines.append(f"sqrt(a) = {Calculator.sqrt(a)}")
+    lines.append(f"sin(a) ≈ {Calculator.sin(a)}")
+    lines.append(f"cos(a) ≈ {Calculator.cos(a)}")
+    return lines
+
+def _similarity_report(s1, s2):
+    return [f"Levenshtein 距离：{levenshtein_distance(s1, s2)}",
+            f"相似度比率：{similarity_ratio(s1, s2):.2f}"]
+
+def main_menu():
+    while True:
+        for line in _MENU_LINES:
+            output(line)
+        choice = user_input("请选择一个选项：")
+        if choice == '1':
+            output("【数学运算测试】")
+            try:
+                a = float(user_input("输入数字 a: "))
+                b = float(user_input("输入数字 b: "))
+            except Exception as e:
+                output("输入错误：" + str(e))
+                continue
+            for line in _math_report(a, b):
+                output(line)
+        elif choice == '2':
+            output("【随机数生成测试】")
+            try:
+                seed = int(user_input("输入种子（整数）："))
+            except Exception as e:
+                output("输入错误：" + str(e))
+                continue
+            rng = RandomGenerator(seed)
+            output("生成的随机数（0~1）： " + str(rng.random()))
+            try:
+                lower = int(user_input("输入下界："))
+                upper = int(user_input("输入上界："))
+            except Exception as e:
+                output("输入错误：" + str(e))
+                continue
+            output("生成的随机整数： " + str(rng.randint(lower, upper)))
+        elif choice == '3':
+            output("【字符串长度检测测试】")
+            s = user_input("请输入字符串：")
+            output("字符串长度为：" + str(check_length(s)))
+        elif choice == '4':
+            output("【相似度比较测试】")
+            s1 = user_input("输入第一个字符串：")
+            s2 = user_input("输入第二个字符串：")
+            for line in _similarity_report(s1, s2):
+                output(line)
+        elif choice == '5':
+            cmd_sorting()
+        elif choice == '6':
+            output("【彩色输出测试】")
+            ColorOutput.print_colored("这是红色文本", "red")
+            ColorOutput.print_colored("这是绿色文本", "green")
+            ColorOutput.print_colored("这是蓝色文本", "blue")
+        elif choice == '7':
+            output("【系统信息测试】")
+            output("HWID: " + SystemInfo.get_hwid())
+            output("Cookies: " + SystemInfo.get_cookies())
+        elif choice == '8':
+            output("【延迟函数测试】 开始延迟...")
+            delay(1)
+            output("延迟结束。")
+        elif choice == '9':
+            output("【printf 测试】")
+            output("请输入测试字符串（支持 \\nt, %winver, %verx, %getc:盘符, %getfps:, 以及 $宏）：")
+            test_str = user_input("")
+            printf(test_str)
+        elif choice == '10':
+            output("【定义新宏】")
+            macro_name = user_input("请输入宏名称（不含 $）：")
+            macro_value = user_input("请输入宏值：")
+            define_macro(macro_name, macro_value)
+            output(f"已定义宏: ${macro_name} = {macro_value}")
+        elif choice == '11':
+            output("退出。")
+            break
+        else:
+            output("无效选择，请重新输入。")
+
+# =======================
+# 异步主菜单
+# =======================
+async def _async_cmd_sorting(console):
+    await console.output("欢迎进入排序命令行界面！")
+    await console.output("请选择排序算法：")
+    for key in sorted(_SORTING_MENU.keys(), key=lambda x: int(x)):
+        await console.output(f"{key}. {_SORTING_MENU[key][0]}")
+    choice = await console.input("请输入选项编号：")
+    if choice not in _SORTING_MENU:
+        await console.output("无效选择，退出排序命令行。")
+        return
+    method_name, method_func = _SORTING_MENU[choice]
+    await console.output(f"你选择了：{method_name}")
+    arr_str = await console.input("请输入一组数字（以空格分隔）：")
+    try:
+        arr = [int(x) for x in arr_str.split()]
+    except ValueError:
+        await console.output("输入格式错误，必须为数字。")
+        return
+    if choice in _QUADRATIC_CHOICES and len(arr) > 5000:
+        await console.output("提示：该算法为 O(n²)，数据量较大时建议选择 13. 自动选择(auto)")
+    sorted_arr = await console.run(method_func, arr)
+    await console.output("排序前数组：" + str(arr))
+    await console.output("排序后数组：" + str(sorted_arr))
+
+async def async_main_menu(reader=None, writer=None, executor=None):
+    """
+    main_menu 的异步版本：排序、数学运算与相似度计算在执行器中运行，延迟使用 async_delay。
+    可为每个连接各启动一个会话，例如在 asyncio.start_server 的回调中 await async_main_menu(reader, writer)
+    """
+    console = AsyncConsole(reader, writer, executor)
+    try:
+        while True:
+            for line in _MENU_LINES:
+                await console.output(line)
+            choice = await console.input("请选择一个选项：")
+            if choice == '1':
+                await console.output("【数学运算测试】")
+                try:
+                    a = float(await console.input("输入数字 a: "))
+                    b = float(await console.input("输入数字 b: "))
+                except ValueError as e:
+                    await console.output("输入错误：" + str(e))
+                    continue
+                try:
+                    lines = await console.run(_math_report, a, b)
+                except ValueError as e:
+                    lines = ["错误: " + str(e)]
+                for line in lines:
+                    await console.output(line)
+            elif choice == '2':
+                await console.output("【随机数生成测试】")
+                try:
+                    seed = int(await console.input("输入种子（整数）："))
+                except ValueError as e:
+                    await console.output("输入错误：" + str(e))
+                    continue
+                rng = RandomGenerator(seed)
+                await console.output("生成的随机数（0~1）： " + str(rng.random()))
+                try:
+                    lower = int(await console.input("输入下界："))
+                    upper = int(await console.input("输入上界："))
+                except ValueError as e:
+                    await console.output("输入错误：" + str(e))
+                    continue
+                await console.output("生成的随机整数： " + str(rng.randint(lower, upper)))
+            elif choice == '3':
+                await console.output("【字符串长度检测测试】")
+                s = await console.input("请输入字符串：")
+                await console.output("字符串长度为：" + str(check_length(s)))
+            elif choice == '4':
+                await console.output("【相似度比较测试】")
+                s1 = await console.input("输入第一个字符串：")
+                s2 = await console.input("输入第二个字符串：")
+                for line in await console.run(_similarity_report, s1, s2):
+                    await console.output(line)
+            elif choice == '5':
+                await _async_cmd_sorting(console)
+            elif choice == '6':
+                await console.output("【彩色输出测试】")
+                await console.output(ColorOutput.colored_text("这是红色文本", "red"))
+                await console.output(ColorOutput.colored_text("这是绿色文本", "green"))
+                await console.output(ColorOutput.colored_text("这是蓝色文本", "blue"))
+            elif choice == '7':
+                await console.output("【系统信息测试】")
+                await console.output("HWID: " + SystemInfo.get_hwid())
+                await console.output("Cookies: " + SystemInfo.get_cookies())
+            elif choice == '8':
+                await console.output("【延迟函数测试】 开始延迟...")
+                await async_delay(1)
+                await console.output("延迟结束。")
+            elif choice == '9':
+                await console.output("【printf 测试】")
+                await console.output("请输入测试字符串（支持 \\nt, %winver, %verx, %getc:盘符, %getfps:, 以及 $宏）：")
+                await console.printf(await console.input(""))
+            elif choice == '10':
+                await console.output("【定义新宏】")
+                macro_name = await console.input("请输入宏名称（不含 $）：")
+                macro_value = await console.input("请输入宏值：")
+                define_macro(macro_name, macro_value)
+                await console.output(f"已定义宏: ${macro_name} = {macro_value}")
+            elif choice == '11':
+                await console.output("退出。")
+                break
+            else:
+                await console.output("无效选择，请重新输入。")
+    except EOFError:
+        pass
+    finally:
+        await console.flush()
+
+# =======================
+# 基准测试命令行
+# =======================
+# 这些标准库模块导入开销较大，import PyFunLibs 时不应加载，只在首次使用相关功能时导入
+_LAZY_STDLIB = ("re", "platform", "ctypes", "asyncio", "argparse", "json", "pickle", "shutil", "tempfile",
+                "tracemalloc", "subprocess", "concurrent.futures", "multiprocessing")
+
+def _parse_importtime(stderr):
+    """
+    解析 -X importtime 的输出，返回 [(模块名, 嵌套层级, 累计耗时微秒), ...]
+    """
+    entries = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue
+        raw = fields[2].rstrip()
+        name = raw.lstrip()
+        entries.append((name, (len(raw) - len(name) - 1) // 2, int(fields[1])))
+    return entries
+
+def benchmark_import(statement="import PyFunLibs", repeat=5):
+    """
+    在全新的子进程中以 python -X importtime 执行 statement，重复 repeat 次取中位数。
+    与空语句的启动过程对比，得到 statement 额外导入的模块、总耗时（微秒），
+    以及其中本应延迟加载的重量级标准库模块（lazy_violations 非空即为回归）
+    """
+    import subprocess
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ)
+    env["PYTHONPATH"] = root + (os.pathsep + env["PYTHONPATH"] if env.get("PYTHONPATH") else "")
+
+    def run(code):
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                                env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True)
+        if result.returncode != 0:
+            raise ValueError("执行失败：" + (result.stderr.strip().splitlines() or ["未知错误"])[-1])
+        return _parse_importtime(result.stderr)
+
+    startup = {name for name, _, _ in run("pass")}
+    totals = []
+    samples = {}
+    for _ in range(max(1, repeat)):
+        total = 0
+        for name, level, cumulative in run(statement):
+            if name in startup:
+                continue
+            samples.setdefault(name, []).append(cumulative)
+            if level == 0:
+                total += cumulative
+        totals.append(total)
+    modules = {name: sorted(values)[len(values) // 2] for name, values in samples.items()}
+    return {
+        'statement': statement,
+        'repeat': len(totals),
+        'total_us': sorted(totals)[len(totals) // 2],
+        'modules': dict(sorted(modules.items(), key=lambda item: -item[1])),
+        'lazy_violations': sorted(name for name in modules if name in _LAZY_STDLIB),
+    }
+
+def _format_import_report(report, baseline=None, budget=None):
+    lines = [f"{'module':<40}{'cumulative(ms)':>16}"]
+    for name, cumulative in list(report['modules'].items())[:15]:
+        lines.append(f"{name:<40}{cumulative / 1000:>16.3f}")
+    summary = f"{report['statement']}: {report['total_us'] / 1000:.3f} ms（{report['repeat']} 次取中位数）"
+    if baseline is not None and baseline.get('total_us'):
+        summary += f"，相对基线 {report['total_us'] / baseline['total_us']:.2f}x"
+    lines.append(summary)
+    if budget is not None and report['total_us'] > budget * 1000:
+        lines.append(f"超出预算 {budget} ms!")
+    if report['lazy_violations']:
+        lines.append("不应在导入时加载的模块: " + ", ".join(report['lazy_violations']))
+    return "\n".join(lines)
+
+def _format_benchmark(report, baseline=None):
+    """
+    把基准结果格式化为文本表格；提供 baseline（旧版本的结果）时附带耗时变化比例
+    """
+    previous = {}
+    if baseline is not None:
+        for entry in baseline['results']:
+            previous[(entry['algorithm'], entry['distribution'], entry['n'])] = entry['seconds']
+    # 表头使用 ASCII，保证等宽终端下列对齐
+    lines = [f"{'algorithm':<16}{'distribution':<15}{'n':>9}{'time(ms)':>12}{'comparisons':>13}{'peak_bytes':>12}{'vs_sorted':>11}"
+             + ("  vs_baseline" if baseline is not None else "")]
+    for entry in report['results']:
+        comparisons = '-' if entry['comparisons'] is None else str(entry['comparisons'])
+        peak = '-' if entry['peak_bytes'] is None else str(entry['peak_bytes'])
+        ratio = f"{entry['vs_sorted']:.1f}x" if entry.get('vs_sorted') is not None else '-'
+        line = (f"{entry['algorithm']:<16}{entry['distribution']:<15}{entry['n']:>9}"
+                f"{entry['seconds'] * 1000:>12.3f}{comparisons:>13}{peak:>12}{ratio:>11}")
+        if baseline is not None:
+            old = previous.get((entry['algorithm'], entry['distribution'], entry['n']))
+            line += f"  {entry['seconds'] / old:.2f}x" if old else "  -"
+        if not entry['correct']:
+            line += "  结果错误!"
+        lines.append(line)
+    return "\n".join(lines)
+
+def bench_main(argv=None):
+    """
+    基准测试命令行：python -m PyFunLibs bench [--sizes 1000,10000] [--json out.json] [--baseline old.json]
+    """
+    import argparse
+    import json
+    parser = argparse.ArgumentParser(prog="PyFunLibs bench", description="Sorter 排序算法基准测试")
+    parser.add_argument("--sizes", default="1000,10000", help="逗号分隔的数据规模")
+    parser.add_argument("--distributions", default=",".join(SORT_DISTRIBUTIONS), help="逗号分隔的数据分布")
+    parser.add_argument("--algorithms", default=",".join(SORT_ALGORITHMS), help="逗号分隔的 Sorter 方法名")
+    parser.add_argument("--repeat", type=int, default=3, help="每项重复次数（取最佳）")
+    parser.add_argument("--seed", type=int, default=0, help="RandomGenerator 种子")
+    parser.add_argument("--quadratic-cap", type=int, default=2000, help="O(n²) 算法的最大规模")
+    parser.add_argument("--no-ops", action="store_true", help="不统计比较次数与峰值内存")
+    parser.add_argument("--no-builtin", action="store_true", help="不与内置 sorted 对比")
+    parser.add_argument("--json", metavar="PATH", help="把结果写为 JSON（- 表示标准输出）")
+    parser.add_argument("--baseline", metavar="PATH", help="与之前保存的 JSON 结果对比")
+    parser.add_argument("--rng", action="store_true", help="改为测试各随机数后端的吞吐量")
+    parser.add_argument("--trig", action="store_true", help="改为测试 Calculator.sin 的精度与速度")
+    parser.add_argument("--count", type=int, default=200000, help="--rng/--trig 模式下每项生成的数量")
+    parser.add_argument("--import", dest="import_time", action="store_true", help="改为用 -X importtime 测量导入耗时")
+    parser.add_argument("--statement", default="import PyFunLibs", help="--import 模式下测量的语句")
+    parser.add_argument("--budget", type=float, metavar="MS", help="--import 模式下的耗时上限，超出时返回非零")
+    args = parser.parse_args(argv)
+    if args.import_time:
+        import_report = benchmark_import(args.statement, repeat=args.repeat)
+        baseline = None
+        if args.baseline:
+            with open(args.baseline, 'r', encoding='utf-8') as f:
+                baseline = json.load(f)
+        if args.json == "-":
+            output(json.dumps(import_report, ensure_ascii=False, indent=2))
+        else:
+            output(_format_import_report(import_report, baseline, args.budget))
+            if args.json:
+                with open(args.json, 'w', encoding='utf-8') as f:
+                    json.dump(import_report, f, ensure_ascii=False, indent=2)
+        over_budget = args.budget is not None and import_report['total_us'] > args.budget * 1000
+        return 1 if over_budget or import_report['lazy_violations'] else 0
+    if args.trig:
+        trig_report = benchmark_trig(args.count, seed=args.seed)
+        if args.json == "-":
+            output(json.dumps(trig_report, ensure_ascii=False, indent=2))
+            return 0
+        lines = [f"{'range':<8}{'bound':>8}{'max_abs':>11}{'max_rel':>11}{'math(ms)':>10}{'sin(ms)':>10}{'many(ms)':>10}"]
+        for label, row in trig_report.items():
+            lines.append(f"{label:<8}{row['bound']:>8.0e}{row['max_abs_error']:>11.2e}{row['max_rel_error']:>11.2e}"
+                         f"{row['math_sin'] * 1000:>10.2f}{row['sin'] * 1000:>10.2f}{row['sin_many'] * 1000:>10.2f}")
+        output("\n".join(lines))
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(trig_report, f, ensure_ascii=False, indent=2)
+        return 0
+    if args.rng:
+        rng_report = benchmark_rng(args.count, seed=args.seed)
+        if args.json == "-":
+            output(json.dumps(rng_report, ensure_ascii=False, indent=2))
+            return 0
+        lines = [f"{'backend':<16}{'random(M/s)':>13}{'randint(M/s)':>14}{'array(M/s)':>12}"]
+        for name, row in rng_report.items():
+            bulk = f"{row['random_array']:.2f}" if 'random_array' in row else '-'
+            lines.append(f"{name:<16}{row['random']:>13.2f}{row['randint']:>14.2f}{bulk:>12}")
+        output("\n".join(lines))
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(rng_report, f, ensure_ascii=False, indent=2)
+        return 0
+    report = benchmark_sorter(
+        sizes=[int(x) for x in args.sizes.split(",") if x],
+        distributions=[x for x in args.distributions.split(",") if x],
+        algorithms=[x for x in args.algorithms.split(",") if x],
+        repeat=args.repeat, seed=args.seed, quadratic_cap=args.quadratic_cap,
+        measure_ops=not args.no_ops, compare_builtin=not args.no_builtin)
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    if args.json == "-":
+        output(json.dumps(report, ensure_ascii=False, indent=2))
+    else:
+        output(_format_benchmark(report, baseline))
+        if args.json:
+            with open(args.json, 'w', encoding='utf-8') as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+    return 0 if all(entry['correct'] for entry in report['results']) else 1
+
+# =======================
+# 批处理命令行（非交互）
+# =======================
+import io
+from collections import deque
+
+_READ_CHUNK = 1 << 20
+_WRITE_BATCH = 65536
+
+def _open_stream(path, mode):
+    """
+    打开二进制流；path 为 None 或 '-' 时使用标准输入/输出。返回 (流, 是否需要关闭)
+    """
+    if path in (None, '-'):
+        return (sys.stdin.buffer if 'r' in mode else sys.stdout.buffer), False
+    return open(path, mode), True
+
+def _iter_number_chunks(stream, parse=int, chunk_size=_READ_CHUNK):
+    """
+    按块读取字节流，解析空白分隔的数字（int/float 直接接受 bytes，无需先解码）；
+    被块边界截断的数字留到下一块。每次产出一个数字列表
+    """
+    tail = b""
+    while True:
+        block = stream.read(chunk_size)
+        if not block:
+            break
+        block = tail + block
+        cut = max(block.rfind(b" "), block.rfind(b"\n"), block.rfind(b"\t"), block.rfind(b"\r"))
+        if cut < 0:
+            tail = block
+            continue
+        tail = block[cut + 1:]
+        values = list(map(parse, block[:cut].split()))
+        if values:
+            yield values
+    if tail.strip():
+        yield list(map(parse, tail.split()))
+
+def _write_values(stream, values):
+    """
+    每行一个值，分批编码后写出
+    """
+    for start in range(0, len(values), _WRITE_BATCH):
+        part = values[start:start + _WRITE_BATCH]
+        stream.write(("\n".join(map(str, part)) + "\n").encode("utf-8"))
+
+def _report_stats(stats):
+    sys.stderr.write("[stats] " + " ".join(
+        f"{name}={value:.3f}s" if isinstance(value, float) else f"{name}={value}"
+        for name, value in stats.items()) + "\n")
+
+def _ordered_pool_map(func, chunks, jobs):
+    """
+    用进程池按顺序处理各块并逐块产出结果；在途任务不超过 2*jobs，内存有界
+    """
+    if jobs <= 1:
+        for chunk in chunks:
+            yield func(chunk)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    pending = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(func, chunk))
+            if len(pending) >= 2 * jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown()
+
+def _pair_scores(pairs):
+    """
+    工作进程：为一批 (s1, s2) 计算编辑距离与相似度，返回输出行
+    """
+    lines = []
+    for s1, s2 in pairs:
+        lines.append(f"{s1}\t{s2}\t{levenshtein_distance(s1, s2)}\t{similarity_ratio(s1, s2):.4f}\n")
+    return lines
+
+def _read_pairs(stream):
+    for lineno, line in enumerate(io.TextIOWrapper(stream, encoding="utf-8"), 1):
+        line = line.rstrip("\r\n")
+        if not line:
+            continue
+        fields = line.split("\t")
+        if len(fields) != 2:
+            raise ValueError(f"第 {lineno} 行应为两列（制表符分隔）")
+        yield fields[0], fields[1]
+
+def _cli_sort(args):
+    parse = float if args.float else int
+    stats = {}
+    src, close_src = _open_stream(args.input, 'rb')
+    dst, close_dst = _open_stream(args.output, 'wb')
+    try:
+        start = time.perf_counter()
+        if args.memory_limit:
+            # 超出内存预算的数据交给 ExternalSorter，读取、排序与写出均为流式
+            sorter = ExternalSorter(memory_limit=int(args.memory_limit * 1024 * 1024),
+                                    algorithm='merge' if args.algo == 'parallel_merge' else args.algo)
+            records = (value for chunk in _iter_number_chunks(src, parse) for value in chunk)
+            count = 0
+            for batch in _chunked(sorter.sort(records), _WRITE_BATCH):
+                _write_values(dst, batch)
+                count += len(batch)
+            stats['项数'] = count
+            stats['总计'] = time.perf_counter() - start
+        else:
+            values = []
+            for chunk in _iter_number_chunks(src, parse):
+                values.extend(chunk)
+            parsed = time.perf_counter()
+            if args.jobs > 1 or args.algo == 'parallel_merge':
+                result = Sorter.parallel_merge(values, jobs=args.jobs)
+            else:
+                result = getattr(Sorter, args.algo)(values)
+            sorted_at = time.perf_counter()
+            _write_values(dst, result)
+            dst.flush()
+            stats['项数'] = len(values)
+            stats['读取'] = parsed - start
+            stats['排序'] = sorted_at - parsed
+            stats['写出'] = time.perf_counter() - sorted_at
+    finally:
+        if close_src:
+            src.close()
+        if close_dst:
+            dst.close()
+        else:
+            dst.flush()
+    if args.stats:
+        _report_stats(stats)
+    return 0
+
+def _cli_similarity(args):
+    start = time.perf_counter()
+    count = 0
+    src, close_src = _open_stream(args.pairs if args.pairs else args.corpus, 'rb')
+    dst, close_dst = _open_stream(args.output, 'wb')
+    try:
+        if args.pairs:
+            for lines in _ordered_pool_map(_pair_scores, _chunked(_read_pairs(src), args.chunk_size), args.jobs):
+                dst.write("".join(lines).encode("utf-8"))
+                count += len(lines)
+        else:
+            corpus = [line.rstrip("\r\n") for line in io.TextIOWrapper(src, encoding="utf-8")]
+            for i, j, ratio in similarity_pairs(corpus, args.threshold, jobs=args.jobs):
+                dst.write(f"{i}\t{j}\t{ratio:.4f}\n".encode("utf-8"))
+                count += 1
+    finally:
+        if close_src:
+            src.close()
+        if close_dst:
+            dst.close()
+        else:
+            dst.flush()
+    if args.stats:
+        _report_stats({'输出行数': count, '总计': time.perf_counter() - start})
+    return 0
+
+def _cli_printf(args):
+    start = time.perf_counter()
+    for item in args.define:
+        name, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"--define 参数应为 名称=值：{item}")
+        define_macro(name, value)
+    if args.template is not None:
+        src, close_src = _open_stream(args.template, 'rb')
+        try:
+            lines = io.TextIOWrapper(src, encoding="utf-8").read().splitlines()
+        finally:
+            if close_src:
+                src.close()
+    else:
+        lines = args.text
+    # 每行与交互式 printf 一致地编译（有缓存）、渲染，整体以块模式写出
+    with buffered_output('block'):
+        for line in lines:
+            printf(line)
+    if args.stats:
+        _report_stats({'行数': len(lines), '总计': time.perf_counter() - start})
+    return 0
+
+_CLI_MATH_OPS = ('sqrt', 'sin', 'cos', 'factorial', 'log_factorial')
+
+def _cli_math(args):
+    parse = int if args.op == 'factorial' else float
+    start = time.perf_counter()
+    count = 0
+    src, close_src = _open_stream(args.input, 'rb')
+    dst, close_dst = _open_stream(args.output, 'wb')
+    try:
+        for chunk in _iter_number_chunks(src, parse):
+            if args.op == 'sqrt':
+                result = Calculator.sqrt_many(chunk, errors=args.errors)
+                if args.errors == 'mask':
+                    result = result[0]
+            elif args.op == 'sin':
+                result = Calculator.sin_many(chunk)
+            elif args.op == 'cos':
+                result = Calculator.cos_many(chunk)
+            elif args.op == 'factorial':
+                result = [Calculator.factorial(n) for n in chunk]
+            else:
+                result = [Calculator.log_factorial(x) for x in chunk]
+            _write_values(dst, result.tolist() if isinstance(result, array) else result)
+            count += len(chunk)
+    finally:
+        if close_src:
+            src.close()
+        if close_dst:
+            dst.close()
+        else:
+            dst.flush()
+    if args.stats:
+        _report_stats({'项数': count, '总计': time.perf_counter() - start})
+    return 0
+
+def cli_main(argv=None):
+    """
+    非交互批处理入口：
+      python -m PyFunLibs sort --algo merge --input nums.txt [--jobs 4] [--memory-limit 256] [--stats]
+      python -m PyFunLibs similarity --pairs pairs.tsv [--jobs 4]
+      python -m PyFunLibs similarity --corpus words.txt --threshold 0.8
+      python -m PyFunLibs printf --template file [--define name=value]
+      python -m PyFunLibs math --op sqrt --input nums.txt
+      python -m PyFunLibs bench ...（见 bench_main）
+    输入/输出路径省略或为 '-' 时使用标准输入/输出
+    """
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if argv and argv[0] == "bench":
+        return bench_main(argv[1:])
+    import argparse
+    parser = argparse.ArgumentParser(prog="PyFunLibs", description="PyFunLibs 批处理命令行")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("sort", help="对数字流排序，每行输出一个数")
+    p.add_argument("--algo", default="auto", choices=SORT_ALGORITHMS, help="Sorter 算法")
+    p.add_argument("--input", help="输入文件（空白分隔的数字，默认标准输入）")
+    p.add_argument("--output", help="输出文件（默认标准输出）")
+    p.add_argument("--float", action="store_true", help="按浮点数解析")
+    p.add_argument("--jobs", type=int, default=1, help="并行进程数（>1 时使用 parallel_merge）")
+    p.add_argument("--memory-limit", type=float, metavar="MB", help="内存预算，超出时使用外部排序")
+    p.add_argument("--stats", action="store_true", help="在标准错误输出耗时统计")
+    p.set_defaults(handler=_cli_sort)
+
+    p = sub.add_parser("similarity", help="批量计算字符串相似度")
+    group = p.add_mutually_exclusive_group(required=True)
+    group.add_argument("--pairs", help="制表符分隔的字符串对文件（- 为标准输入）")
+    group.add_argument("--corpus", help="每行一个字符串，输出相似度不低于阈值的下标对")
+    p.add_argument("--threshold", type=float, default=0.9, help="--corpus 模式的相似度阈值")
+    p.add_argument("--output", help="输出文件（默认标准输出）")
+    p.add_argument("--jobs", type=int, default=1, help="并行进程数")
+    p.add_argument("--chunk-size", type=int, default=2000, help="每个任务处理的字符串对数")
+    p.add_argument("--stats", action="store_true", help="在标准错误输出耗时统计")
+    p.set_defaults(handler=_cli_similarity)
+
+    p = sub.add_parser("printf", help="按 printf 规则渲染模板")
+    group = p.add_mutually_exclusive_group(required=True)
+    group.add_argument("--template", help="模板文件，每行渲染一次（- 为标准输入）")
+    group.add_argument("--text", nargs="+", help="直接给出的模板字符串")
+    p.add_argument("--define", action="append", default=[], metavar="NAME=VALUE", help="定义宏，可重复")
+    p.add_argument("--stats", action="store_true", help="在标准错误输出耗时统计")
+    p.set_defaults(handler=_cli_printf)
+
+    p = sub.add_parser("math", help="对数字流逐个做数学运算")
+    p.add_argument("--op", required=True, choices=_CLI_MATH_OPS, help="运算")
+    p.add_argument("--input", help="输入文件（默认标准输入）")
+    p.add_argument("--output", help="输出文件（默认标准输出）")
+    p.add_argument("--errors", default="raise", choices=_ERROR_POLICIES, help="sqrt 遇到负数时的处理策略")
+    p.add_argument("--stats", action="store_true", help="在标准错误输出耗时统计")
+    p.set_defaults(handler=_cli_math)
+
+    args = parser.parse_args(argv)
+    # Python 3.11 起 int 与十进制字符串互转默认限制在 4300 位，大数阶乘、大整数排序会因此失败；
+    # 批处理期间解除限制，结束后恢复，避免影响调用 cli_main 的宿主程序
+    max_digits = getattr(sys, "get_int_max_str_digits", None)
+    saved_digits = max_digits() if max_digits is not None else None
+    if saved_digits is not None:
+        sys.set_int_max_str_digits(0)
+    try:
+        return args.handler(args)
+    except BrokenPipeError:
+        # 下游（如 head）提前关闭管道：安静退出，并避免解释器退出时再次刷新 stdout 报错
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        return 1
+    except (ValueError, OSError) as e:
+        sys.stderr.write(f"错误：{e}\n")
+        return 2
+    finally:
+        if saved_digits is not None:
+            sys.set_int_max_str_digits(saved_digits)
+
+_CLI_COMMANDS = ("sort", "similarity", "printf", "math", "bench")
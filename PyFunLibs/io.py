@@ -0,0 +1,526 @@
+"""
+输入输出：彩色输出与流式着色、缓冲输出、printf 模板编译与宏替换、asyncio 异步控制台
+"""
+import os
+import sys
+
+from .system import system_probes
+
+# =======================
+# 彩色输出功能
+# =======================
+from functools import lru_cache
+
+class ColorOutput:
+    COLORS = {
+        'reset': "\033[0m",
+        'red': "\033[31m",
+        'green': "\033[32m",
+        'yellow': "\033[33m",
+        'blue': "\033[34m",
+        'magenta': "\033[35m",
+        'cyan': "\033[36m",
+        'white': "\033[37m",
+        'bold': "\033[1m"
+    }
+    
+    @staticmethod
+    def colored_text(text, color):
+        """
+        color 除 COLORS 中的名称外，也支持 256 色编号、'#rrggbb' 真彩色、'bg:' 背景前缀与 '+' 组合，见 Colorizer
+        """
+        return f"{_ansi_prefix(color)}{text}\033[0m"
+    
+    @staticmethod
+    def print_colored(text, color):
+        output_sink.write_line(ColorOutput.colored_text(text, color))
+
+@lru_cache(maxsize=1024)
+def _ansi_prefix(color):
+    """
+    把颜色描述转换为 ANSI 转义前缀（结果缓存）：
+      'red' / 'bold'       -> COLORS 中的具名样式
+      208 或 '208'         -> 256 色前景
+      '#ff8800'            -> 24 位真彩色前景
+      'bg:blue' / 'bg:#000000' -> 背景色
+      'bold+#ff8800'       -> 多个样式组合
+    无法识别时与旧版一致，返回 reset
+    """
+    reset = ColorOutput.COLORS['reset']
+    if isinstance(color, int):
+        return "\033[38;5;%dm" % color if 0 <= color <= 255 else reset
+    codes = []
+    for part in color.lower().split('+'):
+        layer = 38
+        if part.startswith('bg:'):
+            layer = 48
+            part = part[3:]
+        named = ColorOutput.COLORS.get(part)
+        if named is not None:
+            code = int(named[2:-1])
+            if layer == 48:
+                if not 30 <= code <= 37:
+                    return reset
+                code += 10
+            codes.append(str(code))
+        elif part.isdigit() and int(part) <= 255:
+            codes.append("%d;5;%s" % (layer, part))
+        elif len(part) == 7 and part[0] == '#':
+            try:
+                r, g, b = int(part[1:3], 16), int(part[3:5], 16), int(part[5:7], 16)
+            except ValueError:
+                return reset
+            codes.append("%d;2;%d;%d;%d" % (layer, r, g, b))
+        else:
+            return reset
+    return "\033[" + ";".join(codes) + "m"
+
+def _color_enabled(stream):
+    """
+    遵循 NO_COLOR 约定；输出不是终端（文件、管道）时不着色
+    """
+    if os.environ.get("NO_COLOR"):
+        return False
+    isatty = getattr(stream, "isatty", None)
+    try:
+        return bool(isatty is not None and isatty())
+    except (ValueError, OSError):
+        return False
+
+@lru_cache(maxsize=64)
+def _compile_rules(rules):
+    """
+    把 ((正则, 颜色), ...) 合并成一个带命名分组的正则，一次扫描即可匹配所有规则
+    """
+    import re
+    parts = []
+    styles = {}
+    for i, (pattern, color) in enumerate(rules):
+        name = "r%d" % i
+        parts.append("(?P<%s>%s)" % (name, getattr(pattern, "pattern", pattern)))
+        styles[name] = _ansi_prefix(color)
+    return re.compile("|".join(parts)), styles
+
+class Colorizer:
+    """
+    批量/流式着色器。创建时检测一次输出是否为终端以及 NO_COLOR，
+    不需要着色时所有方法都直接原样返回输入（零开销直通）。
+    所有方法都惰性产出结果，处理大文件时内存占用恒定
+    """
+    def __init__(self, enabled=None, stream=None):
+        if enabled is None:
+            enabled = _color_enabled(sys.stdout if stream is None else stream)
+        self.enabled = enabled
+
+    def colorize(self, pairs):
+        """
+        对 (文本, 颜色) 序列逐项着色，返回生成器
+        """
+        if not self.enabled:
+            return (text for text, _ in pairs)
+        reset = ColorOutput.COLORS['reset']
+        return (_ansi_prefix(color) + text + reset for text, color in pairs)
+
+    def highlight(self, lines, rules):
+        """
+        按规则（{正则: 颜色} 或 [(正则, 颜色), ...]，先列出的规则优先）给每行中的匹配片段着色，返回迭代器
+        """
+        if not self.enabled:
+            return iter(lines)
+        items = rules.items() if isinstance(rules, dict) else rules
+        pattern, styles = _compile_rules(tuple(items))
+        reset = ColorOutput.COLORS['reset']
+
+        def paint(match):
+            return styles[match.lastgroup] + match.group() + reset
+
+        sub = pattern.sub
+        return (sub(paint, line) for line in lines)
+
+    def write(self, chunks, file=None, batch=512):
+        """
+        把字符串块分批合并写到 file（默认写入 output_sink），返回写出的块数
+        """
+        write = output_sink.write if file is None else file.write
+        pending = []
+        count = 0
+        for chunk in chunks:
+            pending.append(chunk)
+            if len(pending) >= batch:
+                write("".join(pending))
+                count += len(pending)
+                pending = []
+        if pending:
+            write("".join(pending))
+            count += len(pending)
+        return count
+
+# =======================
+# 输入/输出封装
+# =======================
+import atexit
+import threading
+from contextlib import contextmanager
+
+_UNSET = object()
+
+class OutputSink:
+    """
+    线程安全的输出汇：output / printf / print_colored 都经由这里写出。
+    mode:
+      - 'unbuffered'：每次写入立即写出并刷新
+      - 'line'：遇到换行即写出并刷新（默认，与旧版逐行 flush 行为一致）
+      - 'block'：缓冲到 block_size 个字符即写出；有内容缓冲时由后台定时器保证
+        最迟 flush_interval 秒后写出（不必等下一次写入）
+      - 'manual'：只在显式调用 flush() 或程序退出时写出
+    target 可以是文件类对象（有 write）、队列（有 put）或可调用对象；None 表示当时的 sys.stdout。
+    缓冲模式下未以换行结尾的片段按线程暂存，该线程写出换行时才整行并入共享缓冲，
+    因此多线程写出的行不会互相穿插；显式 flush()、定时刷新或单行超过 block_size 时才会写出未完成的行
+    """
+    MODES = ('unbuffered', 'line', 'block', 'manual')
+
+    def __init__(self, target=None, mode='line', block_size=1 << 16, flush_interval=0.2):
+        self._lock = threading.RLock()
+        self._chunks = []
+        self._size = 0
+        # 线程 id -> [片段列表, 字符数]：该线程尚未写完的行
+        self._partial = {}
+        self._timer = None
+        self._target = None
+        self.mode = 'line'
+        self.block_size = block_size
+        self.flush_interval = flush_interval
+        self.configure(target=target, mode=mode)
+
+    def configure(self, mode=None, target=_UNSET, block_size=None, flush_interval=None):
+        """
+        修改刷新策略或输出目标；切换前先把已缓冲的内容写到旧目标
+        """
+        if mode is not None and mode not in self.MODES:
+            raise ValueError("未知的输出模式: %s" % mode)
+        if target is not _UNSET and target is not None and not (
+                hasattr(target, 'write') or hasattr(target, 'put') or callable(target)):
+            raise ValueError("不支持的输出目标")
+        with self._lock:
+            self.flush()
+            if mode is not None:
+                self.mode = mode
+            if target is not _UNSET:
+                self._target = target
+            if block_size is not None:
+                self.block_size = block_size
+            if flush_interval is not None:
+                self.flush_interval = flush_interval
+
+    def write(self, text):
+        with self._lock:
+            mode = self.mode
+            if mode == 'unbuffered':
+                self._chunks.append(text)
+                self.flush()
+                return
+            ident = threading.get_ident()
+            pending = self._partial.get(ident)
+            cut = text.rfind("\n") + 1
+            if cut:
+                # 本线程的行已写完：连同之前暂存的片段一起进入共享缓冲
+                if pending is not None:
+                    del self._partial[ident]
+                    self._chunks.extend(pending[0])
+                    self._size += pending[1]
+                    pending = None
+                self._chunks.append(text[:cut])
+                self._size += cut
+                text = text[cut:]
+            if text:
+                if pending is None:
+                    pending = self._partial[ident] = [[], 0]
+                pending[0].append(text)
+                pending[1] += len(text)
+                if pending[1] >= self.block_size:
+                    # 单行过长时不再等待换行，避免无限暂存
+                    del self._partial[ident]
+                    self._chunks.extend(pending[0])
+                    self._size += pending[1]
+            if mode == 'line':
+                if cut:
+                    self._emit()
+            elif mode == 'block':
+                if self._size >= self.block_size:
+                    self._emit()
+                if self._timer is None and (self._chunks or self._partial):
+                    self._schedule_flush()
+
+    def write_line(self, text):
+        self.write(text + "\n")
+
+    def flush(self):
+        """
+        把缓冲内容（包括各线程未写完的行）合并为一次写入交给目标
+        """
+        with self._lock:
+            for chunks, _ in self._partial.values():
+                self._chunks.extend(chunks)
+            self._partial.clear()
+            self._emit()
+
+    def _emit(self):
+        # 只写出共享缓冲中的内容，调用方持有锁
+        if not self._chunks:
+            return
+        data = "".join(self._chunks)
+        self._chunks = []
+        self._size = 0
+        target = self._target if self._target is not None else sys.stdout
+        if hasattr(target, 'write'):
+            target.write(data)
+            target_flush = getattr(target, 'flush', None)
+            if target_flush is not None:
+                target_flush()
+        elif hasattr(target, 'put'):
+            target.put(data)
+        else:
+            target(data)
+
+    def _schedule_flush(self):
+        # 每个刷新周期至多一个守护定时器线程；到期时若仍是 block 模式则整体刷新
+        timer = threading.Timer(self.flush_interval, self._timed_flush)
+        timer.daemon = True
+        self._timer = timer
+        timer.start()
+
+    def _timed_flush(self):
+        with self._lock:
+            self._timer = None
+            if self.mode == 'block':
+                self.flush()
+
+    @contextmanager
+    def buffered(self, mode='block', target=_UNSET, block_size=None, flush_interval=None):
+        """
+        在 with 块内临时切换模式/目标，退出时刷新并恢复原设置
+        """
+        with self._lock:
+            saved = (self.mode, self._target, self.block_size, self.flush_interval)
+            self.configure(mode=mode, target=target, block_size=block_size, flush_interval=flush_interval)
+        try:
+            yield self
+        finally:
+            mode, target, block_size, flush_interval = saved
+            self.configure(mode=mode, target=target, block_size=block_size, flush_interval=flush_interval)
+
+output_sink = OutputSink()
+atexit.register(output_sink.flush)
+
+def buffered_output(mode='block', target=_UNSET, block_size=None, flush_interval=None):
+    """
+    批量输出区域：with buffered_output(): ... 期间的输出合并写出，退出时统一刷新
+    """
+    return output_sink.buffered(mode, target, block_size, flush_interval)
+
+def output(message):
+    output_sink.write_line(str(message))
+
+def user_input(prompt=""):
+    output_sink.write(prompt)
+    # 读取前必须把缓冲中的提示与之前的输出全部写出
+    output_sink.flush()
+    return sys.stdin.readline().strip()
+
+# =======================
+# printf 模板编译与宏替换
+# =======================
+@lru_cache(maxsize=None)
+def _format_token():
+    """
+    单次扫描的标记分词器：字面量之外的每个匹配都是一个标记。首次编译格式串时才导入 re 并编译
+    """
+    import re
+    return re.compile(r"\\nt|%winver|%verx|%getfps:|%getc:([A-Za-z]:|/[^\s:]*:)|\$getc:([A-Za-z]:|/[^\s:]*:)|\$(\w+)")
+
+# 用户通过 define_macro 定义的宏；其余名称在渲染时查 system_probes
+_macros = {}
+
+def _render_builtin(name):
+    return str(system_probes.get(name))
+
+def _render_getc(drive):
+    return system_probes.get("getc", drive)
+
+def _render_macro(name):
+    if name in _macros:
+        return _macros[name]
+    if name in system_probes:
+        return str(system_probes.get(name))
+    return "$" + name
+
+def _render_getc_macro(drive):
+    # 与旧版替换顺序一致：用户定义了 getc 宏时优先按宏替换，盘符部分原样保留
+    if "getc" in _macros:
+        return _macros["getc"] + ":" + drive
+    return _render_getc(drive)
+
+class FormatTemplate:
+    """
+    compile_format 的编译结果：segments 中字符串为字面量，(函数, 参数) 为渲染时求值的标记
+    """
+    __slots__ = ("source", "segments")
+
+    def __init__(self, source, segments):
+        self.source = source
+        self.segments = segments
+
+    def render(self):
+        segments = self.segments
+        if len(segments) == 1 and segments[0].__class__ is str:
+            return segments[0]
+        return "".join(seg if seg.__class__ is str else seg[0](seg[1]) for seg in segments)
+
+@lru_cache(maxsize=256)
+def compile_format(fmt):
+    """
+    把 printf 格式串一次性切分为字面量与标记，返回 FormatTemplate（结果会被缓存）。
+    系统信息只在模板中实际出现对应标记、且渲染时才会读取
+    """
+    segments = []
+    literal = []
+    pos = 0
+    for match in _format_token().finditer(fmt):
+        literal.append(fmt[pos:match.start()])
+        pos = match.end()
+        token = match.group(0)
+        if token == "\\nt":
+            literal.append("\n ")
+            continue
+        if token[0] == "%" and not match.group(1):
+            # %winver / %verx / %getfps: 始终对应内置探测，不受同名用户宏影响
+            marker = (_render_builtin, token[1:].rstrip(":"))
+        elif match.group(1):
+            marker = (_render_getc, match.group(1))
+        elif match.group(2):
+            marker = (_render_getc_macro, match.group(2))
+        else:
+            marker = (_render_macro, match.group(3))
+        text = "".join(literal)
+        if text:
+            segments.append(text)
+        literal = []
+        segments.append(marker)
+    literal.append(fmt[pos:])
+    text = "".join(literal)
+    if text or not segments:
+        segments.append(text)
+    return FormatTemplate(fmt, tuple(segments))
+
+def printf(format_string):
+    """
+    改进版输出函数，对输入字符串中的特殊标记进行替换：
+      - \nt 替换为换行并加空格
+      - %winver 替换为 Windows 版本
+      - %verx 替换为 Windows 位数
+      - %getfps: 替换为 FPS 帧率
+      - %getc:后跟盘符（如 %getc:C:）替换为该盘剩余空间；非 Windows 系统也可写挂载点，如 %getc:/home:
+      - **新增：支持以 "$" 开头的宏替换，可通过 define_macro 定义或使用内置宏**
+    格式串经 compile_format 编译并缓存，重复调用只需拼接一次；替换完成后调用原有 output 函数输出结果
+    """
+    output(compile_format(format_string).render())
+
+def define_macro(name, value):
+    """
+    定义或更新宏，名称不包含 "$" 符号，宏可用于 printf 中 "$宏名" 替换
+    """
+    _macros[name] = str(value)
+
+# =======================
+# 异步前端（asyncio）
+# =======================
+# asyncio 与线程池只在首次使用异步接口时导入
+import functools
+
+_io_executors = {}
+
+def _io_executor(kind="output"):
+    """
+    默认控制台的 I/O 放在两个单线程执行器上，都不阻塞事件循环：
+      - "output"：写出、printf 渲染与刷新，单线程保证输出顺序
+      - "input"：用 sys.stdin.readline 读取 stdin，可能长时间阻塞，因此单独一个线程，
+        等待输入时其他任务的输出照常写出
+    stdin 不交给事件循环读取（connect_read_pipe 会接管并在循环结束时关闭 stdin、
+    把 fd 0 置为非阻塞，预读的行也会随之丢失）
+    """
+    executor = _io_executors.get(kind)
+    if executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        executor = _io_executors.setdefault(
+            kind, ThreadPoolExecutor(max_workers=1, thread_name_prefix="pyfunlibs-" + kind))
+    return executor
+
+class AsyncConsole:
+    """
+    一个异步会话。reader/writer 为 asyncio 的 StreamReader/StreamWriter（例如网络连接）；
+    不指定时使用 stdin 与 output_sink。executor 用于执行耗时计算，
+    默认是事件循环的线程池，传入 ProcessPoolExecutor 可绕开 GIL 真正并行
+    """
+    def __init__(self, reader=None, writer=None, executor=None):
+        self.reader = reader
+        self.writer = writer
+        self.executor = executor
+
+    async def write(self, text):
+        if self.writer is None:
+            import asyncio
+            await asyncio.get_running_loop().run_in_executor(_io_executor(), output_sink.write, text)
+        else:
+            self.writer.write(text.encode("utf-8"))
+            await self.writer.drain()
+
+    async def output(self, message):
+        await self.write(str(message) + "\n")
+
+    async def printf(self, format_string):
+        # 渲染可能触发系统探测（缓存未命中时有系统调用），同样放到 I/O 线程
+        import asyncio
+        loop = asyncio.get_running_loop()
+        text = await loop.run_in_executor(_io_executor(), compile_format(format_string).render)
+        await self.output(text)
+
+    async def flush(self):
+        if self.writer is None:
+            import asyncio
+            await asyncio.get_running_loop().run_in_executor(_io_executor(), output_sink.flush)
+
+    async def input(self, prompt=""):
+        """
+        输出提示并读取一行；输入结束（EOF）时抛出 EOFError
+        """
+        if prompt:
+            await self.write(prompt)
+        await self.flush()
+        if self.reader is None:
+            import asyncio
+            line = await asyncio.get_running_loop().run_in_executor(_io_executor("input"), sys.stdin.readline)
+        else:
+            line = await self.reader.readline()
+            if isinstance(line, bytes):
+                line = line.decode("utf-8", errors="replace")
+        if not line:
+            raise EOFError
+        return line.strip()
+
+    async def run(self, func, *args, timeout=None):
+        """
+        在执行器中运行耗时函数；等待期间事件循环照常调度其他会话。
+        任务被取消或超时时，尚未开始执行的工作会一并取消
+        """
+        import asyncio
+        future = asyncio.get_running_loop().run_in_executor(self.executor, functools.partial(func, *args))
+        return await asyncio.wait_for(future, timeout)
+
+async def async_user_input(prompt=""):
+    return await AsyncConsole().input(prompt)
+
+async def async_output(message):
+    await AsyncConsole().output(message)
+
+async def async_printf(format_string):
+    await AsyncConsole().printf(format_string)
@@ -0,0 +1,563 @@
+"""
+数学运算：Calculator（快速幂、三角函数内核、阶乘与组合数、批量运算）
+"""
+# =======================
+# 数学运算（Calculator）
+# =======================
+import math
+import operator
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import repeat
+
+from .random import RandomGenerator, _write_buffer
+
+class Calculator:
+    @staticmethod
+    def add(a, b):
+        return a + b
+
+    @staticmethod
+    def subtract(a, b):
+        return a - b
+
+    @staticmethod
+    def multiply(a, b):
+        return a * b
+
+    @staticmethod
+    def divide(a, b):
+        if b == 0:
+            raise ValueError("除数不能为0")
+        return a / b
+
+    @staticmethod
+    def power(a, b, mod=None):
+        """
+        计算 a 的 b 次幂：
+        - 整数指数使用二进制快速幂，O(log b) 次乘法；负指数返回倒数
+        - 指定 mod 时计算 a^b mod m（负指数使用模逆元）
+        - 非整数指数通过 exp(b*ln a) 计算，底数必须为非负数
+        """
+        if mod is not None:
+            return _power_mod(a, b, mod)
+        if isinstance(b, float) and b.is_integer():
+            b = int(b)
+        if isinstance(b, int):
+            if b >= 0:
+                return _power_int(a, b)
+            if a == 0:
+                raise ValueError("0 不能取负数次幂")
+            return 1 / _power_int(a, -b)
+        if a < 0:
+            raise ValueError("负数的非整数次幂不是实数")
+        if a == 0:
+            if b < 0:
+                raise ValueError("0 不能取负数次幂")
+            return 0.0
+        return math.exp(b * math.log(a))
+
+    @staticmethod
+    def sqrt(x, tolerance=1e-10):
+        if x < 0:
+            raise ValueError("负数无平方根")
+        guess = x if x != 0 else 1
+        while abs(guess * guess - x) > tolerance:
+            guess = (guess + x / guess) / 2
+        return guess
+
+    @staticmethod
+    def factorial(n):
+        """
+        计算 n!：大 n 使用乘积树（二分拆分）让大整数乘法两边规模接近；
+        最近的结果保存在有界 LRU 缓存中，相近的 n 从缓存的检查点增量推出
+        """
+        if n < 0:
+            raise ValueError("负数没有阶乘")
+        if n < _FACTORIAL_SMALL:
+            result = 1
+            for i in range(2, n + 1):
+                result *= i
+            return result
+        cache = _factorial_cache
+        # 缓存只在锁内读写（Calculator 可能在线程池中并发调用），大整数乘法在锁外进行
+        with _factorial_lock:
+            if n in cache:
+                cache.move_to_end(n)
+                return cache[n]
+            # 找最近的检查点：距离不超过 n/8 时增量推导比从头计算便宜
+            nearest = min(cache, key=lambda m: abs(m - n), default=None)
+            base = cache[nearest] if nearest is not None and abs(nearest - n) <= n // 8 else None
+        if base is None:
+            result = _product_range(2, n + 1)
+        elif nearest < n:
+            result = base * _product_range(nearest + 1, n + 1)
+        else:
+            result = base // _product_range(n + 1, nearest + 1)
+        with _factorial_lock:
+            cache[n] = result
+            cache.move_to_end(n)
+            while len(cache) > _FACTORIAL_CACHE_SIZE:
+                cache.popitem(last=False)
+        return result
+
+    @staticmethod
+    def binomial(n, k):
+        """
+        组合数 C(n, k)；k > n 时为 0
+        """
+        if n < 0 or k < 0:
+            raise ValueError("组合数的参数不能为负数")
+        if k > n:
+            return 0
+        k = min(k, n - k)
+        return _product_range(n - k + 1, n + 1) // Calculator.factorial(k)
+
+    @staticmethod
+    def log_factorial(n):
+        """
+        返回 ln(n!)（n 可为非负实数，即 lnΓ(n+1)），不需要精确值时远快于 factorial。
+        小整数直接取精确阶乘的对数，其余先用递推把参数抬到 64 以上再用 Stirling 级数
+        """
+        if n < 0:
+            raise ValueError("负数没有阶乘")
+        if isinstance(n, int) and n < _FACTORIAL_SMALL:
+            return math.log(Calculator.factorial(n))
+        x = float(n)
+        # lnΓ(x+1) = lnΓ(x+2) - ln(x+1)；先累乘再取一次对数，减少舍入
+        product = 1.0
+        while x < 64.0:
+            x += 1.0
+            product *= x
+        shift = -math.log(product)
+        inv = 1.0 / x
+        inv2 = inv * inv
+        series = inv * (1.0 / 12 - inv2 * (1.0 / 360 - inv2 * (1.0 / 1260 - inv2 * (1.0 / 1680))))
+        return x * math.log(x) - x + 0.5 * math.log(2.0 * math.pi * x) + series + shift
+
+    @staticmethod
+    def sin(x, terms=10):
+        """
+        正弦：先把 x 约化到 [-π/4, π/4]，再用 Horner 法计算 terms 项泰勒多项式
+        """
+        return _sin_value(float(x), *_trig_tables(terms))
+
+    @staticmethod
+    def cos(x, terms=10):
+        """
+        余弦：与 sin 共用约化与多项式内核
+        """
+        return _cos_value(float(x), *_trig_tables(terms))
+
+    @staticmethod
+    def sincos(x, terms=10):
+        """
+        同时返回 (sin x, cos x)，只做一次参数约化
+        """
+        sin_coeffs, cos_coeffs = _trig_tables(terms)
+        quadrant, r = _reduce_half_pi(float(x))
+        s = _sin_kernel(r, sin_coeffs)
+        c = _cos_kernel(r, cos_coeffs)
+        if quadrant == 0:
+            return s, c
+        if quadrant == 1:
+            return c, -s
+        if quadrant == 2:
+            return -s, -c
+        return -c, s
+
+    @staticmethod
+    def sin_many(values, terms=10, out=None):
+        """
+        批量计算正弦，返回 array('d')；指定 out 时写入该可写缓冲区并返回 out
+        """
+        sin_coeffs, cos_coeffs = _trig_tables(terms)
+        data = array('d', [_sin_value(float(x), sin_coeffs, cos_coeffs) for x in values])
+        return data if out is None else _write_buffer(out, data)
+
+    @staticmethod
+    def cos_many(values, terms=10, out=None):
+        """
+        批量计算余弦，返回 array('d')；指定 out 时写入该可写缓冲区并返回 out
+        """
+        sin_coeffs, cos_coeffs = _trig_tables(terms)
+        data = array('d', [_cos_value(float(x), sin_coeffs, cos_coeffs) for x in values])
+        return data if out is None else _write_buffer(out, data)
+
+    # ---------- 批量（逐元素）运算 ----------
+    # a、b 可以是序列、array.array、任意支持缓冲区协议的对象或标量（自动广播）；
+    # 结果为 array('d')（输入含 numpy 数组时为 ndarray），指定 out 时写入 out 并返回 out。
+    # errors 决定除零/负数开方的处理：'raise' 抛出 ValueError，'nan' 填充 NaN，
+    # 'mask' 同样填充 NaN 并返回 (结果, 掩码)，掩码为 array('B')，1 表示该位置无效
+
+    @staticmethod
+    def add_many(a, b, out=None):
+        return _elementwise(operator.add, 'add', a, b, out)
+
+    @staticmethod
+    def subtract_many(a, b, out=None):
+        return _elementwise(operator.sub, 'subtract', a, b, out)
+
+    @staticmethod
+    def multiply_many(a, b, out=None):
+        return _elementwise(operator.mul, 'multiply', a, b, out)
+
+    @staticmethod
+    def divide_many(a, b, out=None, errors='raise'):
+        _check_policy(errors)
+        np = _load_numpy()
+        if np is not None and _wants_numpy(np, a, b, out):
+            xs, ys = _numpy_operands(np, a, b)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                result = np.divide(xs, ys)
+            return _numpy_finish(np, result, ys == 0, out, errors, "除数不能为0", (a, b))
+        xs, ys, n = _broadcast_pair(a, b)
+        if errors == 'raise':
+            if isinstance(b, (int, float)):
+                if b == 0:
+                    raise ValueError("除数不能为0")
+            else:
+                for i, y in enumerate(ys):
+                    if y == 0:
+                        raise ValueError("除数不能为0（位置 %d）" % i)
+            return _finish(array('d', map(operator.truediv, xs, ys)), out)
+        nan = float('nan')
+        data = array('d', [x / y if y else nan for x, y in zip(xs, ys)])
+        if errors == 'nan':
+            return _finish(data, out)
+        if isinstance(b, (int, float)):
+            return _finish(data, out), array('B', [not b]) * n
+        return _finish(data, out), array('B', [not y for y in ys])
+
+    @staticmethod
+    def sqrt_many(values, out=None, errors='raise'):
+        _check_policy(errors)
+        np = _load_numpy()
+        if np is not None and _wants_numpy(np, values, None, out):
+            xs = np.asarray(values, dtype=float)
+            if not xs.ndim:
+                raise ValueError("参数必须是序列")
+            with np.errstate(invalid='ignore'):
+                result = np.sqrt(xs)
+            return _numpy_finish(np, result, xs < 0, out, errors, "负数无平方根", (values,))
+        if isinstance(values, (int, float)):
+            raise ValueError("参数必须是序列")
+        xs = _as_column(values)
+        if errors == 'raise':
+            for i, x in enumerate(xs):
+                if x < 0:
+                    raise ValueError("负数无平方根（位置 %d）" % i)
+            return _finish(array('d', map(math.sqrt, xs)), out)
+        nan = float('nan')
+        sqrt = math.sqrt
+        data = array('d', [sqrt(x) if x >= 0 else nan for x in xs])
+        if errors == 'nan':
+            return _finish(data, out)
+        return _finish(data, out), array('B', [x < 0 for x in xs])
+
+_ERROR_POLICIES = ('raise', 'nan', 'mask')
+_numpy_module = None
+
+def _load_numpy():
+    """
+    按需导入 numpy；未安装时返回 None，批量运算走纯 Python 实现
+    """
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy_module = numpy
+    return _numpy_module or None
+
+def _wants_numpy(np, a, b, out):
+    # 标量与标量无需 numpy；其余情况 numpy 的逐元素运算远快于解释器循环
+    return any(isinstance(v, np.ndarray) or not (v is None or isinstance(v, (int, float)))
+               for v in (a, b, out))
+
+def _check_policy(errors):
+    if errors not in _ERROR_POLICIES:
+        raise ValueError("未知的错误处理策略: %s" % errors)
+
+def _as_column(values):
+    """
+    把序列或缓冲区对象转换为可迭代的一维数值列；多维缓冲区按行优先展平
+    """
+    if isinstance(values, (list, tuple, array, range)):
+        return values
+    try:
+        view = memoryview(values)
+    except TypeError:
+        return list(values)
+    if view.ndim != 1:
+        view = view.cast('B').cast(view.format)
+    return view
+
+def _broadcast_pair(a, b):
+    """
+    返回 (xs, ys, n)：标量一侧用 repeat 广播；两侧都是序列时 n 为 None
+    """
+    a_scalar = isinstance(a, (int, float))
+    b_scalar = isinstance(b, (int, float))
+    if a_scalar and b_scalar:
+        raise ValueError("至少一个参数必须是序列")
+    if a_scalar:
+        ys = _as_column(b)
+        return repeat(a, len(ys)), ys, len(ys)
+    xs = _as_column(a)
+    if b_scalar:
+        return xs, repeat(b, len(xs)), len(xs)
+    ys = _as_column(b)
+    if len(xs) != len(ys):
+        raise ValueError("数组长度不一致")
+    return xs, ys, None
+
+def _elementwise(op, name, a, b, out):
+    np = _load_numpy()
+    if np is not None and _wants_numpy(np, a, b, out):
+        result = getattr(np, name)(*_numpy_operands(np, a, b))
+        return _numpy_finish(np, result, None, out, 'nan', None, (a, b))
+    xs, ys, _ = _broadcast_pair(a, b)
+    return _finish(array('d', map(op, xs, ys)), out)
+
+def _numpy_operands(np, a, b):
+    xs, ys = np.asarray(a, dtype=float), np.asarray(b, dtype=float)
+    # 与纯 Python 路径一致：只允许标量广播，长度不同的两个序列直接报错
+    if not (xs.ndim or ys.ndim):
+        raise ValueError("至少一个参数必须是序列")
+    if xs.ndim and ys.ndim:
+        if xs.size != ys.size:
+            raise ValueError("数组长度不一致")
+        if xs.shape != ys.shape:
+            xs, ys = xs.ravel(), ys.ravel()
+    return xs, ys
+
+def _finish(data, out):
+    return data if out is None else _write_buffer(out, data)
+
+def _numpy_finish(np, result, invalid, out, errors, message, inputs):
+    """
+    numpy 路径的收尾：按策略处理无效位置；输入中没有 ndarray 时转换为与纯 Python 路径一致的 array('d')。
+    掩码总是与纯 Python 路径相同的 array('B')（按行优先展平），错误一律抛出 ValueError
+    """
+    if invalid is not None:
+        invalid = np.broadcast_to(invalid, result.shape)
+        if errors == 'raise' and invalid.any():
+            raise ValueError("%s（位置 %d）" % (message, int(np.argmax(invalid))))
+        result[invalid] = np.nan
+    if isinstance(out, np.ndarray):
+        if out.size < result.size:
+            raise ValueError("输出缓冲区长度不足")
+        np.copyto(out[:result.size], result.ravel())
+        data = out
+    elif out is not None:
+        data = _write_buffer(out, array('d', result.ravel().tobytes()))
+    elif any(isinstance(v, np.ndarray) for v in inputs):
+        data = result
+    else:
+        data = array('d', result.ravel().tobytes())
+    if errors == 'mask':
+        return data, array('B', invalid.ravel().astype(np.uint8).tobytes())
+    return data
+
+_FACTORIAL_SMALL = 64
+_FACTORIAL_CACHE_SIZE = 16
+_factorial_cache = OrderedDict()
+_factorial_lock = threading.Lock()
+
+def _product_range(lo, hi):
+    """
+    计算 lo*(lo+1)*...*(hi-1)，递归二分使每次乘法的两个因子位数相当
+    """
+    if hi - lo <= 32:
+        result = 1
+        for i in range(lo, hi):
+            result *= i
+        return result
+    mid = (lo + hi) // 2
+    return _product_range(lo, mid) * _product_range(mid, hi)
+
+def _power_int(a, n):
+    """
+    二进制快速幂（从低位到高位扫描指数），n 为非负整数
+    """
+    result = 1
+    while n:
+        if n & 1:
+            result *= a
+        n >>= 1
+        if n:
+            a *= a
+    return result
+
+def _power_mod(a, n, mod):
+    if not all(isinstance(v, int) for v in (a, n, mod)):
+        raise ValueError("模幂运算只支持整数")
+    if mod == 0:
+        raise ValueError("模数不能为0")
+    m = abs(mod)
+    if n < 0:
+        a = _mod_inverse(a, m)
+        n = -n
+    a %= m
+    result = 1 % m
+    while n:
+        if n & 1:
+            result = result * a % m
+        n >>= 1
+        if n:
+            a = a * a % m
+    # 与内置 pow 一致：结果符号跟随模数
+    return result if mod > 0 or result == 0 else result + mod
+
+def _mod_inverse(a, m):
+    """
+    扩展欧几里得算法求 a 在模 m 下的逆元
+    """
+    old_r, r = a % m, m
+    old_s, s = 1, 0
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_s, s = s, old_s - q * s
+    if old_r != 1:
+        raise ValueError("底数与模数不互素，逆元不存在")
+    return old_s % m
+
+# 三角函数内核：Cody-Waite 约化 + 泰勒系数表
+# π/2 拆成三段（前两段各 33 位有效数字），k < 2^19 时 k*_PIO2_1、k*_PIO2_2 均无舍入误差
+_PIO2_1 = 1.57079632673412561417e+00
+_PIO2_2 = 6.07710050630396597660e-11
+_PIO2_3 = 2.02226624871116645580e-21
+_TWO_OVER_PI = 0.63661977236758134308
+_CODY_WAITE_LIMIT = 823550.0
+_TRIG_MAX_TERMS = 12
+
+# 泰勒系数 (-1)^n/(2n+1)! 与 (-1)^n/(2n)!，n 从 1 开始
+_SIN_COEFFS = tuple((-1) ** n / Calculator.factorial(2 * n + 1) for n in range(1, _TRIG_MAX_TERMS))
+_COS_COEFFS = tuple((-1) ** n / Calculator.factorial(2 * n) for n in range(1, _TRIG_MAX_TERMS))
+
+@lru_cache(maxsize=None)
+def _trig_tables(terms):
+    """
+    返回 terms 项多项式所需的系数（逆序，供 Horner 使用）；超过系数表长度时按表长截断
+    """
+    if terms < 1:
+        raise ValueError("项数必须为正整数")
+    count = min(terms, _TRIG_MAX_TERMS) - 1
+    return _SIN_COEFFS[:count][::-1], _COS_COEFFS[:count][::-1]
+
+def _sin_kernel(r, coeffs):
+    r2 = r * r
+    p = 0.0
+    for c in coeffs:
+        p = p * r2 + c
+    return r + r * r2 * p
+
+def _cos_kernel(r, coeffs):
+    r2 = r * r
+    p = 0.0
+    for c in coeffs:
+        p = p * r2 + c
+    return 1.0 + r2 * p
+
+def _sin_value(x, sin_coeffs, cos_coeffs):
+    quadrant, r = _reduce_half_pi(x)
+    if quadrant == 0:
+        return _sin_kernel(r, sin_coeffs)
+    if quadrant == 1:
+        return _cos_kernel(r, cos_coeffs)
+    if quadrant == 2:
+        return -_sin_kernel(r, sin_coeffs)
+    return -_cos_kernel(r, cos_coeffs)
+
+def _cos_value(x, sin_coeffs, cos_coeffs):
+    quadrant, r = _reduce_half_pi(x)
+    if quadrant == 0:
+        return _cos_kernel(r, cos_coeffs)
+    if quadrant == 1:
+        return -_sin_kernel(r, sin_coeffs)
+    if quadrant == 2:
+        return -_cos_kernel(r, cos_coeffs)
+    return _sin_kernel(r, sin_coeffs)
+
+def _reduce_half_pi(x):
+    """
+    把 x 写成 k*(π/2) + r，|r| <= π/4，返回 (k mod 4, r)
+    """
+    if -0.7853981633974483 <= x <= 0.7853981633974483:
+        return 0, x
+    if -_CODY_WAITE_LIMIT < x < _CODY_WAITE_LIMIT:
+        k = round(x * _TWO_OVER_PI)
+        return k & 3, ((x - k * _PIO2_1) - k * _PIO2_2) - k * _PIO2_3
+    return _reduce_half_pi_exact(x)
+
+def _reduce_half_pi_exact(x):
+    """
+    大参数约化：用足够位数的 π/2 定点整数做精确的大整数运算
+    """
+    if x != x:
+        return 0, x
+    if x in (float('inf'), float('-inf')):
+        raise ValueError("三角函数的参数必须为有限数")
+    num, den = x.as_integer_ratio()
+    # 精度按 64 位对齐，便于缓存；多出的 128 位足以覆盖最坏情况下的抵消
+    precision = ((max(math.frexp(x)[1], 0) + 128) | 63) + 1
+    half_pi = _half_pi_fixed(precision)
+    scaled = (num << precision) // den
+    k = (2 * scaled + half_pi) // (2 * half_pi)
+    return k & 3, (scaled - k * half_pi) / (1 << precision)
+
+@lru_cache(maxsize=32)
+def _half_pi_fixed(bits):
+    """
+    返回 floor(π/2 * 2^bits)，使用 Machin 公式 π/4 = 4·atan(1/5) - atan(1/239)
+    """
+    guard = bits + 32
+
+    def arctan_inv(n):
+        x = (1 << guard) // n
+        total = x
+        n2 = n * n
+        k = 1
+        sign = -1
+        while x:
+            x //= n2
+            k += 2
+            total += sign * (x // k)
+            sign = -sign
+        return total
+
+    return (2 * (4 * arctan_inv(5) - arctan_inv(239))) >> 32
+
+def benchmark_trig(n=100000, seed=0):
+    """
+    对比 Calculator.sin / sin_many 与 math.sin：各取值范围内的最大绝对/相对误差与耗时（秒）
+    """
+    rng = RandomGenerator(seed)
+    report = {}
+    for label, bound in (('small', 1.0), ('medium', 1e3), ('large', 1e6), ('huge', 1e22)):
+        values = [(2.0 * u - 1.0) * bound for u in rng.random_array(n)]
+        start = time.perf_counter()
+        expected = [math.sin(x) for x in values]
+        t_math = time.perf_counter() - start
+        start = time.perf_counter()
+        for x in values:
+            Calculator.sin(x)
+        t_single = time.perf_counter() - start
+        start = time.perf_counter()
+        got = Calculator.sin_many(values)
+        t_many = time.perf_counter() - start
+        max_abs = max_rel = 0.0
+        for a, b in zip(got, expected):
+            err = abs(a - b)
+            max_abs = max(max_abs, err)
+            if b:
+                max_rel = max(max_rel, err / abs(b))
+        report[label] = {'bound': bound, 'max_abs_error': max_abs, 'max_rel_error': max_rel,
+                         'math_sin': t_math, 'sin': t_single, 'sin_many': t_many}
+    return report
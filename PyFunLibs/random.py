@@ -0,0 +1,621 @@
+"""
+随机数生成：线性同余 RandomGenerator 及可插拔的 64 位后端（SplitMix64 / xoshiro256** / PCG64）
+"""
+import os
+
+# =======================
+# 随机数生成（基于线性同余算法）
+# =======================
+import copy
+import math
+from array import array
+from itertools import islice
+
+class RandomGenerator:
+    # 每次 _next() 产生的有效位数
+    _BITS = 31
+
+    def __init__(self, seed=None):
+        if seed is None:
+            # 使用 os.urandom 随机生成一个初始种子
+            seed = int.from_bytes(os.urandom(4), 'little')
+        self.seed = seed
+
+    @classmethod
+    def create(cls, backend='lcg', seed=None):
+        """
+        按名称创建随机数生成器，可选后端见 RNG_BACKENDS：
+        'lcg'（默认，与旧版序列一致）、'splitmix64'、'xoshiro256**'、'pcg64'
+        """
+        try:
+            factory = RNG_BACKENDS[backend]
+        except KeyError:
+            raise ValueError("未知的随机数后端: %s" % backend) from None
+        return factory(seed)
+
+    def _next(self):
+        """
+        推进一步并返回 _BITS 位的原始输出
+        """
+        self.seed = (1103515245 * self.seed + 12345) & 0x7FFFFFFF
+        return self.seed
+
+    def getrandbits(self, k):
+        """
+        返回 k 位随机非负整数；不足一次输出的部分取高位（LCG 的低位周期很短）
+        """
+        if k < 0:
+            raise ValueError("位数不能为负数")
+        bits = self._BITS
+        result = 0
+        shift = 0
+        while k - shift >= bits:
+            result |= self._next() << shift
+            shift += bits
+        if k > shift:
+            result |= (self._next() >> (bits - (k - shift))) << shift
+        return result
+
+    def randbelow(self, n):
+        """
+        返回 [0, n) 内无偏的随机整数（Lemire 乘法区间映射 + 少量拒绝采样，几乎不做除法）
+        """
+        if n <= 0:
+            raise ValueError("上界必须为正整数")
+        bits = self._BITS
+        if n > 1 << bits:
+            k = n.bit_length()
+            while True:
+                r = self.getrandbits(k)
+                if r < n:
+                    return r
+        mask = (1 << bits) - 1
+        m = self._next() * n
+        low = m & mask
+        if low < n:
+            # 只有落入低端的少数情况才需要计算阈值并重抽
+            threshold = ((1 << bits) - n) % n
+            while low < threshold:
+                m = self._next() * n
+                low = m & mask
+        return m >> bits
+
+    def spawn(self, n):
+        """
+        派生 n 个彼此独立的子生成器（同一后端），用于多线程/多进程各持一条流
+        """
+        return [type(self)(self.getrandbits(64)) for _ in range(n)]
+
+    def random(self):
+        """
+        返回 0~1 之间的伪随机浮点数
+        常数：a=1103515245, c=12345, m=2^31
+        """
+        self.seed = (1103515245 * self.seed + 12345) & 0x7FFFFFFF
+        return self.seed / 0x80000000
+
+    def randint(self, a, b):
+        """
+        返回 [a, b] 范围内的随机整数（保持旧版算法以便复现，范围很大时有轻微偏差，需要无偏结果请用 randbelow）
+        """
+        return a + int(self.random() * (b - a + 1))
+
+    def random_array(self, n, out=None):
+        """
+        批量生成 n 个 0~1 之间的浮点数，返回 array('d')；指定 out 时写入该可写缓冲区并返回 out。
+        结果与连续调用 n 次 random() 完全一致；按块生成并直接写入结果，额外内存与 n 无关
+        """
+        scale = 1.0 / 0x80000000
+
+        def blocks():
+            seed = self.seed
+            for size in _block_sizes(n):
+                # 列表推导式内联递推，避免逐个调用 random() 的方法调用与属性读写开销
+                block = [(seed := (1103515245 * seed + 12345) & 0x7FFFFFFF) * scale for _ in range(size)]
+                self.seed = seed
+                yield block
+        return _fill_buffer(out, 'd', n, blocks())
+
+    def randint_array(self, n, a, b, out=None):
+        """
+        批量生成 n 个 [a, b] 范围内的随机整数，返回 array('q')；指定 out 时写入该可写缓冲区。
+        结果与连续调用 n 次 randint(a, b) 完全一致
+        """
+        step = (b - a + 1) / 0x80000000
+
+        def blocks():
+            seed = self.seed
+            for size in _block_sizes(n):
+                block = [a + int((seed := (1103515245 * seed + 12345) & 0x7FFFFFFF) * step) for _ in range(size)]
+                self.seed = seed
+                yield block
+        return _fill_buffer(out, 'q', n, blocks())
+
+    def advance(self, n):
+        """
+        把状态向前推进 n 步（等价于调用 n 次 random()），
+        利用仿射变换 x -> a*x + c 的平方合成，耗时 O(log n)
+        """
+        if n < 0:
+            raise ValueError("步数不能为负数")
+        if n:
+            self.seed = _lcg_skip(self.seed, n, 1103515245, 12345, 0x7FFFFFFF)
+        return self
+
+    def jump(self, n):
+        """
+        返回位于当前位置 n 步之后的新生成器，自身状态不变。
+        例如 N 个工作者各取 rng.jump(i * block) 生成 block 个数，拼接结果与单线程顺序生成相同
+        """
+        return copy.copy(self).advance(n)
+
+    def _random_open(self):
+        """
+        返回开区间 (0, 1) 内的浮点数，供取对数使用
+        """
+        while True:
+            u = self.random()
+            if u > 0.0:
+                return u
+
+    def choice(self, seq):
+        """
+        从非空序列中等概率取一个元素
+        """
+        if not seq:
+            raise IndexError("不能从空序列中选择")
+        return seq[self.randbelow(len(seq))]
+
+    def shuffle(self, x):
+        """
+        原地 Fisher-Yates 洗牌，每种排列等概率
+        """
+        below = self.randbelow
+        for i in range(len(x) - 1, 0, -1):
+            j = below(i + 1)
+            x[i], x[j] = x[j], x[i]
+
+    def sample(self, population, k):
+        """
+        无放回地抽取 k 个元素，返回新列表（按抽取顺序）
+        """
+        n = len(population)
+        if not 0 <= k <= n:
+            raise ValueError("样本数量超出总体大小")
+        below = self.randbelow
+        if k * 4 <= n:
+            # k 远小于 n 时只记录已选下标，不复制整个总体
+            picked = set()
+            result = []
+            while len(result) < k:
+                j = below(n)
+                if j not in picked:
+                    picked.add(j)
+                    result.append(population[j])
+            return result
+        pool = list(population)
+        # 只做前 k 步的部分 Fisher-Yates
+        for i in range(k):
+            j = i + below(n - i)
+            pool[i], pool[j] = pool[j], pool[i]
+        return pool[:k]
+
+    def choices(self, population, weights=None, k=1):
+        """
+        有放回地抽取 k 个元素；给定 weights 时按权重抽取。
+        每次调用都要用 O(n) 时间建立别名表，同一组权重需要反复抽样时请改用 weighted_sampler
+        """
+        n = len(population)
+        if not n:
+            raise IndexError("不能从空序列中选择")
+        if weights is None:
+            below = self.randbelow
+            return [population[below(n)] for _ in range(k)]
+        return self.weighted_sampler(weights, population)(k)
+
+    def weighted_sampler(self, weights, population=None):
+        """
+        按权重建立一次 Vose 别名表，返回可重复使用的 WeightedSampler：
+        之后每次抽取 O(1)，不再重新处理权重。population 为 None 时抽取的是下标
+        """
+        return WeightedSampler(self, weights, population)
+
+    def reservoir_sample(self, iterable, k):
+        """
+        从任意长度（可以是无界）的迭代器中单遍等概率抽取 k 个元素，内存 O(k)。
+        采用 Algorithm L：直接按几何分布计算跳过的元素个数，期望只生成 O(k log(N/k)) 个随机数
+        """
+        if k < 0:
+            raise ValueError("样本数量不能为负数")
+        it = iter(iterable)
+        reservoir = list(islice(it, k))
+        if len(reservoir) < k or k == 0:
+            return reservoir
+        uniform = self._random_open
+        w = math.exp(math.log(uniform()) / k)
+        while True:
+            skip = math.floor(math.log(uniform()) / math.log1p(-w))
+            for item in islice(it, skip, skip + 1):
+                break
+            else:
+                return reservoir
+            reservoir[self.randbelow(k)] = item
+            w *= math.exp(math.log(uniform()) / k)
+
+class WeightedSampler:
+    """
+    RandomGenerator.weighted_sampler 的结果：持有别名表与所用的生成器，
+    sampler(k) 有放回地抽取 k 个元素（或下标）；len(sampler) 为总体大小
+    """
+    __slots__ = ("rng", "population", "prob", "alias")
+
+    def __init__(self, rng, weights, population=None):
+        n = len(weights)
+        if population is not None and len(population) != n:
+            raise ValueError("权重数量与总体大小不一致")
+        if not n:
+            raise IndexError("不能从空序列中选择")
+        self.rng = rng
+        self.population = population
+        self.prob, self.alias = _alias_table(weights)
+
+    def __len__(self):
+        return len(self.prob)
+
+    def __call__(self, k=1):
+        prob, alias, population = self.prob, self.alias, self.population
+        below, rand = self.rng.randbelow, self.rng.random
+        n = len(prob)
+        result = []
+        for _ in range(k):
+            i = below(n)
+            if rand() >= prob[i]:
+                i = alias[i]
+            result.append(i if population is None else population[i])
+        return result
+
+def _alias_table(weights):
+    """
+    Vose 别名法：返回 (prob, alias)，抽样时先均匀选桶 i，再以 prob[i] 的概率取 i，否则取 alias[i]
+    """
+    n = len(weights)
+    total = float(sum(weights))
+    if total <= 0 or any(w < 0 for w in weights):
+        raise ValueError("权重必须非负且总和为正")
+    scaled = [w * n / total for w in weights]
+    prob = [1.0] * n
+    alias = list(range(n))
+    small = [i for i, p in enumerate(scaled) if p < 1.0]
+    large = [i for i, p in enumerate(scaled) if p >= 1.0]
+    while small and large:
+        s = small.pop()
+        l = large[-1]
+        prob[s] = scaled[s]
+        alias[s] = l
+        scaled[l] -= 1.0 - scaled[s]
+        if scaled[l] < 1.0:
+            large.pop()
+            small.append(l)
+    # 剩余的桶因浮点误差略偏离 1，直接视为满桶
+    return prob, alias
+
+def _lcg_skip(state, n, mult, inc, mask):
+    """
+    计算线性同余递推 x -> (mult*x + inc) & mask 执行 n 次后的状态（二进制分解，O(log n)）
+    """
+    acc_mult, acc_inc = 1, 0
+    while n:
+        if n & 1:
+            acc_mult = (acc_mult * mult) & mask
+            acc_inc = (acc_inc * mult + inc) & mask
+        inc = ((mult + 1) * inc) & mask
+        mult = (mult * mult) & mask
+        n >>= 1
+    return (acc_mult * state + acc_inc) & mask
+
+# 批量生成时每块的元素个数：块内用列表推导式摊薄解释器开销，块间直接写入结果，峰值内存有界
+_FILL_BLOCK = 1 << 12
+
+def _block_sizes(n):
+    for start in range(0, n, _FILL_BLOCK):
+        yield min(_FILL_BLOCK, n - start)
+
+def _fill_buffer(out, typecode, n, blocks):
+    """
+    把 blocks 依次产生的数据块（list 或 array）写入 out 的前 n 项，返回 out。
+    out 为 None 时新建 array(typecode)；否则可以是 list、array 或任意支持缓冲区协议的可写对象。
+    长度不足时在消费 blocks 之前就报错，生成器状态保持不变
+    """
+    if out is None:
+        out = array(typecode, [0]) * n
+    if isinstance(out, list):
+        if len(out) < n:
+            raise ValueError("输出缓冲区长度不足")
+        pos = 0
+        for block in blocks:
+            out[pos:pos + len(block)] = block
+            pos += len(block)
+        return out
+    if isinstance(out, array):
+        typecode = out.typecode
+    with memoryview(out) as raw:
+        view = raw if raw.format == typecode else raw.cast('B').cast(typecode)
+        try:
+            if len(view) < n:
+                raise ValueError("输出缓冲区长度不足")
+            pos = 0
+            for block in blocks:
+                if not (isinstance(block, array) and block.typecode == typecode):
+                    block = array(typecode, block)
+                view[pos:pos + len(block)] = block
+                pos += len(block)
+        finally:
+            if view is not raw:
+                view.release()
+    return out
+
+def _write_buffer(out, data):
+    """
+    把 array 数据写入 out（list、array 或任意支持缓冲区协议的可写对象），返回 out
+    """
+    return _fill_buffer(out, data.typecode, len(data), (data,))
+
+# =======================
+# 可插拔随机数后端（SplitMix64 / xoshiro256** / PCG64）
+# =======================
+import time
+
+_MASK64 = (1 << 64) - 1
+_MASK128 = (1 << 128) - 1
+
+def _random_seed():
+    return int.from_bytes(os.urandom(16), 'little')
+
+def _rotl64(x, k):
+    return ((x << k) | (x >> (64 - k))) & _MASK64
+
+class _Generator64(RandomGenerator):
+    """
+    64 位输出后端的公共部分：random() 取高 53 位，randint() 走无偏的 randbelow()
+    """
+    _BITS = 64
+
+    def random(self):
+        return (self._next() >> 11) * (1.0 / (1 << 53))
+
+    def randint(self, a, b):
+        if b < a:
+            raise ValueError("区间上界不能小于下界")
+        return a + self.randbelow(b - a + 1)
+
+    def random_array(self, n, out=None):
+        nxt = self._next
+        scale = 1.0 / (1 << 53)
+        blocks = ([(nxt() >> 11) * scale for _ in range(size)] for size in _block_sizes(n))
+        return _fill_buffer(out, 'd', n, blocks)
+
+    def randint_array(self, n, a, b, out=None):
+        if b < a:
+            raise ValueError("区间上界不能小于下界")
+        below = self.randbelow
+        span = b - a + 1
+        blocks = ([a + below(span) for _ in range(size)] for size in _block_sizes(n))
+        return _fill_buffer(out, 'q', n, blocks)
+
+class SplitMix64Generator(_Generator64):
+    """
+    SplitMix64：状态为一个 64 位计数器，输出经过两轮乘法混合。
+    速度最快，也用于给其他后端展开种子
+    """
+    _GAMMA = 0x9E3779B97F4A7C15
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = _random_seed()
+        self.seed = seed
+        self._state = seed & _MASK64
+
+    def _next(self):
+        self._state = z = (self._state + 0x9E3779B97F4A7C15) & _MASK64
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+        return z ^ (z >> 31)
+
+    def advance(self, n):
+        if n < 0:
+            raise ValueError("步数不能为负数")
+        self._state = (self._state + n * self._GAMMA) & _MASK64
+        return self
+
+class Xoshiro256Generator(_Generator64):
+    """
+    xoshiro256**：256 位状态，周期 2^256-1，统计质量好且只用移位/异或/小乘法。
+    spawn() 通过 2^128 步跳跃得到互不重叠的子流
+    """
+    # 特征多项式在首次任意步跳跃时由 Berlekamp-Massey 求出并缓存
+    _charpoly = None
+
+    def __init__(self, seed=None):
+        if seed is None:
+            seed = _random_seed()
+        self.seed = seed
+        mixer = SplitMix64Generator(seed)
+        state = tuple(mixer._next() for _ in range(4))
+        if not any(state):
+            state = (1, 0, 0, 0)
+        self._s = state
+
+    def _next(self):
+        s0, s1, s2, s3 = self._s
+        result = (_rotl64((s1 * 5) & _MASK64, 7) * 9) & _MASK64
+        t = (s1 << 17) & _MASK64
+        s2 ^= s0
+        s3 ^= s1
+        s1 ^= s2
+        s0 ^= s3
+        s2 ^= t
+        self._s = (s0, s1, s2, _rotl64(s3, 45))
+        return result
+
+    def advance(self, n):
+        """
+        前进 n 步，O(log n) 次 GF(2) 多项式乘法再加 256 次状态步进
+        """
+        if n < 0:
+            raise ValueError("步数不能为负数")
+        if n < 256:
+            for _ in range(n):
+                self._next()
+            return self
+        poly = _gf2_powmod(n, self._characteristic())
+        a0 = a1 = a2 = a3 = 0
+        for k in range(256):
+            if (poly >> k) & 1:
+                s0, s1, s2, s3 = self._s
+                a0 ^= s0
+                a1 ^= s1
+                a2 ^= s2
+                a3 ^= s3
+            self._next()
+        self._s = (a0, a1, a2, a3)
+        return self
+
+    @classmethod
+    def _characteristic(cls):
+        if cls._charpoly is None:
+            probe = cls(1)
+            bits = []
+            for _ in range(512):
+                bits.append(probe._s[0] & 1)
+                probe._next()
+            cls._charpoly = _berlekamp_massey_gf2(bits)
+        return cls._charpoly
+
+    def spawn(self, n):
+        children = []
+        for _ in range(n):
+            children.append(copy.copy(self))
+            self.advance(1 << 128)
+        return children
+
+class PCG64Generator(_Generator64):
+    """
+    PCG64（XSL-RR 输出）：128 位 LCG 状态 + 置换输出。
+    stream 选择不同的增量，得到互相独立的序列；advance 复用 _lcg_skip
+    """
+    _MULT = 0x2360ED051FC65DA44385DF649FCCF645
+
+    def __init__(self, seed=None, stream=0):
+        if seed is None:
+            seed = _random_seed()
+        self.seed = seed
+        self._inc = ((stream << 1) | 1) & _MASK128
+        self._state = 0
+        self._next()
+        self._state = (self._state + seed) & _MASK128
+        self._next()
+
+    def _next(self):
+        self._state = state = (self._state * 0x2360ED051FC65DA44385DF649FCCF645 + self._inc) & _MASK128
+        rot = state >> 122
+        x = ((state >> 64) ^ state) & _MASK64
+        return ((x >> rot) | (x << (-rot & 63))) & _MASK64
+
+    def advance(self, n):
+        if n < 0:
+            raise ValueError("步数不能为负数")
+        if n:
+            self._state = _lcg_skip(self._state, n, self._MULT, self._inc, _MASK128)
+        return self
+
+    def spawn(self, n):
+        # 每个子生成器使用不同的增量（stream），序列互不相交
+        return [PCG64Generator(self.getrandbits(128), self.getrandbits(127)) for _ in range(n)]
+
+def _berlekamp_massey_gf2(bits):
+    """
+    求 GF(2) 上生成比特序列的最短线性递推，返回特征多项式（整数的第 i 位为 x^i 的系数）
+    """
+    conn, prev = 1, 1
+    length, gap = 0, 1
+    for i, bit in enumerate(bits):
+        d = bit
+        for j in range(1, length + 1):
+            d ^= (conn >> j) & bits[i - j]
+        if not d:
+            gap += 1
+        elif 2 * length <= i:
+            conn, prev = conn ^ (prev << gap), conn
+            length = i + 1 - length
+            gap = 1
+        else:
+            conn ^= prev << gap
+            gap += 1
+    # 连接多项式取倒序即特征多项式
+    poly = 0
+    for j in range(length + 1):
+        if (conn >> j) & 1:
+            poly |= 1 << (length - j)
+    return poly
+
+def _gf2_mulmod(a, b, poly):
+    degree = poly.bit_length() - 1
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        b >>= 1
+        a <<= 1
+        if (a >> degree) & 1:
+            a ^= poly
+    return result
+
+def _gf2_powmod(n, poly):
+    """
+    计算 x^n mod poly（GF(2) 多项式）
+    """
+    result, base = 1, 2
+    while n:
+        if n & 1:
+            result = _gf2_mulmod(result, base, poly)
+        base = _gf2_mulmod(base, base, poly)
+        n >>= 1
+    return result
+
+RNG_BACKENDS = {
+    'lcg': RandomGenerator,
+    'splitmix64': SplitMix64Generator,
+    'xoshiro256**': Xoshiro256Generator,
+    'pcg64': PCG64Generator,
+}
+
+def benchmark_rng(n=200000, backends=None, seed=12345):
+    """
+    对比各后端（以及标准库 random）生成 n 个浮点数 / n 个整数的吞吐量，单位：百万个每秒
+    """
+    import random as _py_random
+    names = list(RNG_BACKENDS) if backends is None else list(backends)
+    report = {}
+    for name in names + ['stdlib']:
+        if name == 'stdlib':
+            rng = _py_random.Random(seed)
+            bulk = None
+        else:
+            rng = RandomGenerator.create(name, seed)
+            bulk = rng.random_array
+        rand, randint = rng.random, rng.randint
+        start = time.perf_counter()
+        for _ in range(n):
+            rand()
+        t_random = time.perf_counter() - start
+        start = time.perf_counter()
+        for _ in range(n):
+            randint(1, 1000)
+        t_randint = time.perf_counter() - start
+        row = {'random': n / t_random / 1e6, 'randint': n / t_randint / 1e6}
+        if bulk is not None:
+            start = time.perf_counter()
+            bulk(n)
+            row['random_array'] = n / (time.perf_counter() - start) / 1e6
+        report[name] = row
+    return report
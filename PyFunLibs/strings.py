@@ -0,0 +1,458 @@
+"""
+字符串：长度检测、Levenshtein 编辑距离与相似度、BK 树模糊索引、批量相似度与近似重复聚类
+"""
+import os
+
+# =======================
+# 长度检测函数
+# =======================
+def check_length(x):
+    return len(x)
+
+# =======================
+# 字符串相似度比较
+# =======================
+def levenshtein_distance(s1, s2, max_distance=None):
+    """
+    计算 Levenshtein 编辑距离
+    先剥离公共前缀/后缀，再使用 Myers/Hyyrö 位并行算法（Python 整数不限位宽，
+    长串无需分块）；元素不可哈希时退回两行 DP（O(min(m,n)) 内存）。
+    指定 max_distance 时，距离超过上限即提前停止并返回 max_distance + 1
+    """
+    if max_distance is not None and max_distance < 0:
+        raise ValueError("max_distance 不能为负数")
+    # 剥离公共前缀与后缀
+    start = 0
+    end1, end2 = len(s1), len(s2)
+    while start < end1 and start < end2 and s1[start] == s2[start]:
+        start += 1
+    while end1 > start and end2 > start and s1[end1 - 1] == s2[end2 - 1]:
+        end1 -= 1
+        end2 -= 1
+    s1, s2 = s1[start:end1], s2[start:end2]
+    # 令 s1 为较短的一方
+    if len(s1) > len(s2):
+        s1, s2 = s2, s1
+    m, n = len(s1), len(s2)
+    if max_distance is not None and n - m > max_distance:
+        return max_distance + 1
+    if m == 0:
+        return n
+    try:
+        return _levenshtein_bitparallel(s1, s2, max_distance)
+    except TypeError:
+        return _levenshtein_rows(s1, s2, max_distance)
+
+def _levenshtein_bitparallel(s1, s2, max_distance=None):
+    """
+    Myers/Hyyrö 位并行编辑距离，s1 作为模式串（非空），每列 O(1) 次整数位运算
+    """
+    m, n = len(s1), len(s2)
+    peq = {}
+    for i, ch in enumerate(s1):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    mask = (1 << m) - 1
+    last = 1 << (m - 1)
+    vp, vn = mask, 0
+    score = m
+    # 最后一行每向右一列最多减少 1，剩余列数不足以回落到上限内时提前结束
+    limit = None if max_distance is None else max_distance + n
+    for j, ch in enumerate(s2):
+        eq = peq.get(ch, 0)
+        d0 = (((eq & vp) + vp) ^ vp) | eq | vn
+        hp = vn | ~(d0 | vp)
+        hn = vp & d0
+        if hp & last:
+            score += 1
+        elif hn & last:
+            score -= 1
+        if limit is not None and score + j + 1 > limit:
+            return max_distance + 1
+        hp = (hp << 1) | 1
+        vn = (hp & d0) & mask
+        vp = ((hn << 1) | ~(d0 | hp)) & mask
+    if max_distance is not None and score > max_distance:
+        return max_distance + 1
+    return score
+
+def _levenshtein_rows(s1, s2, max_distance=None):
+    """
+    两行滚动数组的编辑距离（s1 为较短串），指定 max_distance 时只计算宽度为
+    2*max_distance+1 的对角带（Ukkonen），整行超出上限即提前返回
+    """
+    m, n = len(s1), len(s2)
+    k = n if max_distance is None else max_distance
+    big = k + 1
+    prev = [j if j <= k else big for j in range(m + 1)]
+    for i in range(1, n + 1):
+        ch = s2[i - 1]
+        lo = max(1, i - k)
+        hi = min(m, i + k)
+        curr = [big] * (m + 1)
+        curr[0] = i if i <= k else big
+        row_min = curr[0]
+        for j in range(lo, hi + 1):
+            cost = 0 if s1[j - 1] == ch else 1
+            value = min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + cost)
+            if value > big:
+                value = big
+            curr[j] = value
+            if value < row_min:
+                row_min = value
+        if row_min > k:
+            return big
+        prev = curr
+    return prev[m] if prev[m] <= k else big
+
+def similarity_ratio(s1, s2, min_ratio=None):
+    """
+    基于编辑距离的相似度比率（0~1）
+    指定 min_ratio 时按对应的最大编辑距离提前截断，低于阈值直接返回 0.0
+    """
+    if len(s1) == 0 and len(s2) == 0:
+        return 1.0
+    longest = max(len(s1), len(s2))
+    if min_ratio is None:
+        dist = levenshtein_distance(s1, s2)
+        return 1 - dist / longest
+    dist = levenshtein_distance(s1, s2, _max_edits(longest, min_ratio))
+    ratio = 1 - dist / longest
+    return ratio if ratio >= min_ratio else 0.0
+
+def _max_edits(length, min_ratio):
+    """
+    相似度不低于 min_ratio 时允许的最大编辑距离（留出浮点误差余量）
+    """
+    if min_ratio <= 0:
+        return length
+    return max(0, int((1 - min_ratio) * length + 1e-9))
+
+# =======================
+# 模糊索引（BK 树，一对多相似度查询）
+# =======================
+import heapq
+
+class FuzzyIndex:
+    """
+    基于 BK 树的模糊字符串索引：利用编辑距离的三角不等式剪枝，
+    nearest/within 查询只需访问语料的一小部分。
+    节点以平铺列表保存（无递归），删除采用墓碑标记，墓碑过多时自动重建
+    """
+    _FORMAT_VERSION = 1
+
+    def __init__(self, words=None):
+        self._words = []     # 节点对应的词
+        self._children = []  # 每个节点的子节点：{距离: 节点下标}
+        self._reach = []     # 每个节点子边的最大距离，用于截断距离计算
+        self._alive = []     # 节点是否有效（删除后为 False）
+        self._nodes = {}     # 词 -> 节点下标（含已删除节点）
+        self._size = 0
+        if words is not None:
+            for word in words:
+                self.add(word)
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, word):
+        idx = self._nodes.get(word)
+        return idx is not None and self._alive[idx]
+
+    def __iter__(self):
+        for word, alive in zip(self._words, self._alive):
+            if alive:
+                yield word
+
+    def add(self, word):
+        """
+        添加一个词，已存在时返回 False
+        """
+        idx = self._nodes.get(word)
+        if idx is not None:
+            if self._alive[idx]:
+                return False
+            self._alive[idx] = True
+            self._size += 1
+            return True
+        new_idx = len(self._words)
+        if new_idx:
+            node = 0
+            while True:
+                dist = levenshtein_distance(word, self._words[node])
+                child = self._children[node].get(dist)
+                if child is None:
+                    self._children[node][dist] = new_idx
+                    if dist > self._reach[node]:
+                        self._reach[node] = dist
+                    break
+                node = child
+        self._words.append(word)
+        self._children.append({})
+        self._reach.append(0)
+        self._alive.append(True)
+        self._nodes[word] = new_idx
+        self._size += 1
+        return True
+
+    def remove(self, word):
+        """
+        删除一个词，不存在时返回 False；墓碑数量超过有效词数时重建树
+        """
+        idx = self._nodes.get(word)
+        if idx is None or not self._alive[idx]:
+            return False
+        self._alive[idx] = False
+        self._size -= 1
+        if len(self._words) - self._size > self._size:
+            self._rebuild()
+        return True
+
+    def _rebuild(self):
+        words = list(self)
+        self.__init__(words)
+
+    def within(self, query, max_distance):
+        """
+        返回与 query 编辑距离不超过 max_distance 的所有词，
+        结果为 [(词, 距离), ...]，按距离升序排列
+        """
+        if max_distance < 0:
+            raise ValueError("max_distance 不能为负数")
+        results = []
+        if not self._words:
+            return results
+        words, children, reach, alive = self._words, self._children, self._reach, self._alive
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            dist = levenshtein_distance(query, words[node], max_distance + reach[node])
+            if dist <= max_distance and alive[node]:
+                results.append((dist, node))
+            edges = children[node]
+            if edges:
+                lo, hi = dist - max_distance, dist + max_distance
+                for edge, child in edges.items():
+                    if lo <= edge <= hi:
+                        stack.append(child)
+        results.sort()
+        return [(words[node], dist) for dist, node in results]
+
+    def nearest(self, query, k=1):
+        """
+        返回与 query 最接近的 k 个词，结果为 [(词, 距离), ...]，按距离升序排列；
+        按三角不等式下界做最佳优先遍历，查询半径随已找到的第 k 近距离收缩
+        """
+        if k <= 0 or not self._words:
+            return []
+        words, children, reach, alive = self._words, self._children, self._reach, self._alive
+        best = []      # 大顶堆：(-距离, -节点下标)
+        radius = None
+        frontier = [(0, 0)]  # 小顶堆：(子树距离下界, 节点下标)
+        while frontier:
+            lower, node = heapq.heappop(frontier)
+            if radius is not None and lower >= radius:
+                break
+            bound = None if radius is None else radius + reach[node]
+            dist = levenshtein_distance(query, words[node], bound)
+            if alive[node] and (radius is None or dist < radius):
+                heapq.heappush(best, (-dist, -node))
+                if len(best) > k:
+                    heapq.heappop(best)
+                if len(best) == k:
+                    radius = -best[0][0]
+            for edge, child in children[node].items():
+                gap = abs(dist - edge)
+                if radius is None or gap < radius:
+                    heapq.heappush(frontier, (max(gap, lower), child))
+        found = sorted((-d, -n) for d, n in best)
+        return [(words[node], dist) for dist, node in found]
+
+    def save(self, path):
+        """
+        将索引保存到文件（pickle 格式，先写临时文件再原子替换）
+        """
+        state = {
+            'version': self._FORMAT_VERSION,
+            'words': self._words,
+            'children': self._children,
+            'reach': self._reach,
+            'alive': self._alive,
+        }
+        import pickle
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        从 save 生成的文件加载索引（pickle 格式，仅加载可信文件）
+        """
+        import pickle
+        with open(path, 'rb') as f:
+            state = pickle.load(f)
+        if state.get('version') != cls._FORMAT_VERSION:
+            raise ValueError("不支持的索引文件版本")
+        index = cls()
+        index._words = state['words']
+        index._children = state['children']
+        index._reach = state['reach']
+        index._alive = state['alive']
+        index._nodes = {word: i for i, word in enumerate(index._words)}
+        index._size = sum(index._alive)
+        return index
+
+# =======================
+# 批量相似度与近似重复聚类
+# =======================
+from bisect import bisect_left
+from collections import deque
+
+def _qgram_counts(s, q):
+    counts = {}
+    for i in range(len(s) - q + 1):
+        gram = s[i:i + q]
+        counts[gram] = counts.get(gram, 0) + 1
+    return counts
+
+def _candidate_pairs(corpus, threshold, q):
+    """
+    分块生成候选对：按长度升序处理每个串，只与长度窗口内的已处理串配对；
+    若 q-gram 计数下界为正，还要求共享的 q-gram 数不少于该下界
+    """
+    order = sorted(range(len(corpus)), key=lambda i: len(corpus[i]))
+    lengths = []
+    postings = {}  # q-gram -> deque[(处理序号, 出现次数)]
+    for pos, i in enumerate(order):
+        s = corpus[i]
+        length = len(s)
+        max_edits = _max_edits(length, threshold)
+        start = bisect_left(lengths, length - max_edits)
+        # 编辑距离不超过 d 的两个串至少共享 L - q + 1 - q*d 个 q-gram（L 为较长者长度）
+        need = length - q + 1 - q * max_edits
+        grams = _qgram_counts(s, q)
+        if need <= 0:
+            for p in range(start, pos):
+                j = order[p]
+                yield (j, i) if j < i else (i, j)
+        else:
+            shared = {}
+            for gram, count in grams.items():
+                plist = postings.get(gram)
+                if not plist:
+                    continue
+                # 长度窗口下界单调不减，窗口外的条目可永久丢弃
+                while plist and plist[0][0] < start:
+                    plist.popleft()
+                for p, other in plist:
+                    shared[p] = shared.get(p, 0) + (count if count < other else other)
+            for p, count in shared.items():
+                if count >= need:
+                    j = order[p]
+                    yield (j, i) if j < i else (i, j)
+        for gram, count in grams.items():
+            plist = postings.get(gram)
+            if plist is None:
+                plist = postings[gram] = deque()
+            plist.append((pos, count))
+        lengths.append(length)
+
+def _chunked(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _similarity_chunk(pairs, threshold):
+    """
+    工作进程：校验一批候选对，返回相似度达到阈值的 (i, j, ratio)
+    """
+    results = []
+    for i, j, s1, s2 in pairs:
+        ratio = similarity_ratio(s1, s2, threshold)
+        if ratio >= threshold:
+            results.append((i, j, ratio))
+    return results
+
+def similarity_pairs(corpus, threshold=0.9, q=2, jobs=None, chunk_size=2000):
+    """
+    流式返回语料中相似度不低于 threshold 的所有 (i, j, ratio)（i < j），不构造 n² 矩阵。
+    候选对先经长度分桶与共享 q-gram 过滤，再分块交给进程池校验；
+    jobs 为进程数（默认 CPU 核数，为 1 时在当前进程计算），多进程时结果顺序不固定
+    """
+    if not 0 < threshold <= 1:
+        raise ValueError("threshold 必须在 (0, 1] 范围内")
+    if q < 1:
+        raise ValueError("q 必须为正整数")
+    corpus = list(corpus)
+    chunks = _chunked(((i, j, corpus[i], corpus[j])
+                       for i, j in _candidate_pairs(corpus, threshold, q)), chunk_size)
+    workers = jobs or os.cpu_count() or 1
+    if workers == 1:
+        for chunk in chunks:
+            yield from _similarity_chunk(chunk, threshold)
+        return
+    # 进程池相关模块较重，只在真正需要多进程时导入
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = set()
+    try:
+        for chunk in chunks:
+            pending.add(executor.submit(_similarity_chunk, chunk, threshold))
+            # 限制在途任务数量，保证内存有界
+            if len(pending) >= 2 * workers:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        executor.shutdown()
+
+class _DisjointSet:
+    """
+    并查集（按秩合并 + 路径减半）
+    """
+    def __init__(self, n):
+        self.parent = list(range(n))
+        self.rank = [0] * n
+
+    def find(self, x):
+        parent = self.parent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    def union(self, a, b):
+        ra, rb = self.find(a), self.find(b)
+        if ra == rb:
+            return
+        if self.rank[ra] < self.rank[rb]:
+            ra, rb = rb, ra
+        self.parent[rb] = ra
+        if self.rank[ra] == self.rank[rb]:
+            self.rank[ra] += 1
+
+def dedup_clusters(corpus, threshold=0.9, q=2, jobs=None, chunk_size=2000):
+    """
+    近似重复聚类：对 similarity_pairs 的结果做并查集合并（传递闭包），
+    返回成员数不少于 2 的簇，每个簇为升序下标列表，簇按最小下标排序
+    """
+    corpus = list(corpus)
+    groups = _DisjointSet(len(corpus))
+    for i, j, _ in similarity_pairs(corpus, threshold, q, jobs, chunk_size):
+        groups.union(i, j)
+    clusters = {}
+    for i in range(len(corpus)):
+        clusters.setdefault(groups.find(i), []).append(i)
+    return [members for members in clusters.values() if len(members) > 1]
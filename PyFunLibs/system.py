@@ -0,0 +1,298 @@
+"""
+系统：硬件标识、版本/位数/磁盘空间/FPS 探测及其 TTL 缓存注册表、精确延迟
+"""
+import os
+import sys
+
+# =======================
+# 系统信息获取
+# =======================
+from functools import lru_cache
+
+class SystemInfo:
+    @staticmethod
+    def get_hwid():
+        """
+        获取简易硬件标识（经 system_probes 获取；结果依赖当前工作目录，
+        因此每次都读取 cwd，只有哈希计算按目录缓存）
+        """
+        return system_probes.get("hwid")
+
+    @staticmethod
+    def _compute_hwid():
+        """
+        利用当前工作目录、系统平台和 Python 版本生成一个简单哈希值（仅作示例）
+        """
+        return SystemInfo._hash_hwid(os.getcwd())
+
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _hash_hwid(cwd):
+        info = cwd + os.sep + sys.platform + sys.version
+        hwid = 0
+        for ch in info:
+            hwid = (hwid * 31 + ord(ch)) & 0xFFFFFFFF
+        return hex(hwid)
+    
+    @staticmethod
+    def get_cookies():
+        """
+        模拟获取 Cookies 信息（由于只允许使用 sys 与 os，无网络支持，此处返回固定字符串）
+        """
+        return "cookie1=value1; cookie2=value2;"
+
+# =======================
+# 延迟函数（睡眠 + 校准后的短暂忙等）
+# =======================
+import time
+
+_SPIN_MIN = 0.0001
+_SPIN_MAX = 0.02
+# 协程版本的忙等窗口上限：逼近阶段每轮都跑一遍事件循环，占满 CPU，窗口要比同步版本短得多
+_ASYNC_SPIN_MAX = 0.002
+# 最后这段时间用忙等补齐；随 sleep 的实际超时量自动调整
+_spin_window = 0.001
+
+def _record_overshoot(overshoot):
+    """
+    自校准：sleep 多睡的时间比窗口大时立即放大窗口，否则缓慢收缩（保留 1.5 倍余量）
+    """
+    global _spin_window
+    wanted = overshoot * 1.5
+    if wanted > _spin_window:
+        window = wanted
+    else:
+        window = _spin_window * 0.9 + wanted * 0.1
+    _spin_window = min(max(window, _SPIN_MIN), _SPIN_MAX)
+
+def calibrate_delay(samples=20):
+    """
+    主动测量若干次短 sleep 的超时量，用约 90 分位数初始化忙等窗口，返回新的窗口（秒）
+    """
+    global _spin_window
+    overs = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        time.sleep(0.0005)
+        overs.append(time.perf_counter() - start - 0.0005)
+    overs.sort()
+    _spin_window = min(max(overs[int(len(overs) * 0.9)] * 1.5, _SPIN_MIN), _SPIN_MAX)
+    return _spin_window
+
+def delay_until(deadline):
+    """
+    等待到 time.perf_counter() 时刻 deadline。
+    周期任务用 next_tick += period; delay_until(next_tick) 可避免误差累积
+    """
+    perf_counter = time.perf_counter
+    while True:
+        remaining = deadline - perf_counter()
+        if remaining <= 0:
+            return
+        if remaining <= _spin_window:
+            break
+        # 大部分时间交给操作系统睡眠，不占用 CPU
+        target = remaining - _spin_window
+        start = perf_counter()
+        time.sleep(target)
+        _record_overshoot(perf_counter() - start - target)
+    while perf_counter() < deadline:
+        pass
+
+def delay(seconds):
+    """
+    精确延迟 seconds 秒：睡眠大部分时间，只在最后不足一毫秒左右的窗口内忙等
+    """
+    if seconds > 0:
+        delay_until(time.perf_counter() + seconds)
+
+async def async_delay_until(deadline):
+    """
+    delay_until 的协程版本：睡眠阶段交给事件循环，最后的窗口用 sleep(0) 让出控制权逐步逼近。
+    逼近阶段其他任务照常运行，但事件循环线程会一直占用 CPU，因此窗口不超过 _ASYNC_SPIN_MAX（2 毫秒），
+    精度相应比同步的 delay_until 略低
+    """
+    import asyncio
+    perf_counter = time.perf_counter
+    remaining = deadline - perf_counter() - min(_spin_window, _ASYNC_SPIN_MAX)
+    if remaining > 0:
+        await asyncio.sleep(remaining)
+    while perf_counter() < deadline:
+        await asyncio.sleep(0)
+
+async def async_delay(seconds):
+    """
+    供 asyncio 使用的 delay：await async_delay(0.5)
+    """
+    if seconds > 0:
+        await async_delay_until(time.perf_counter() + seconds)
+
+# =======================
+# 新扩展功能：新命令标记解析及 printf 改进
+# =======================
+# re、platform 与 ctypes 只在首次探测时导入，import PyFunLibs 不再为它们付出启动开销
+
+def get_winver():
+    """
+    返回系统版本：Windows 上为 Windows 版本号；其他系统返回 uname 的内核名与版本（如 'Linux 6.1.0'）
+    """
+    if sys.platform.startswith("win"):
+        import platform
+        ver, csd, ptype, build = platform.win32_ver()
+        return ver if ver else "未知"
+    try:
+        uname = os.uname()
+    except AttributeError:
+        return "非Windows"
+    return f"{uname.sysname} {uname.release}"
+
+def get_verx():
+    """
+    返回系统位数，如 '64bit' 或 '32bit'
+    """
+    import platform
+    arch, _ = platform.architecture()
+    return arch
+
+def getc(drive="C:"):
+    """
+    读取指定盘符的剩余空间（单位：G）。
+    Windows 使用 GetDiskFreeSpaceExW；POSIX 使用 os.statvfs，参数可为挂载点路径，盘符形式映射到根目录 "/"
+    """
+    if not sys.platform.startswith("win"):
+        # 标记写法 %getc:/mnt/data: 会把结尾的冒号一并传入
+        is_drive = len(drive) == 2 and drive[1] == ":" and drive[0].isascii() and drive[0].isalpha()
+        path = "/" if is_drive else (drive.rstrip(":") or "/")
+        try:
+            st = os.statvfs(path)
+        except (OSError, AttributeError):
+            return "未知"
+        return f"{st.f_bavail * st.f_frsize / (1024**3):.2f}G"
+    import ctypes
+    free_bytes = ctypes.c_ulonglong(0)
+    total_bytes = ctypes.c_ulonglong(0)
+    total_free_bytes = ctypes.c_ulonglong(0)
+    ret = ctypes.windll.kernel32.GetDiskFreeSpaceExW(ctypes.c_wchar_p(drive), ctypes.byref(free_bytes), ctypes.byref(total_bytes), ctypes.byref(total_free_bytes))
+    if ret == 0:
+        return "未知"
+    else:
+        return f"{free_bytes.value / (1024**3):.2f}G"
+
+def get_fps():
+    """
+    返回 FPS 帧率，占位值（例如 60）
+    """
+    return 60
+
+# =======================
+# 系统探测注册表（TTL 缓存 + 可选后台刷新）
+# =======================
+import threading
+
+class ProbeRegistry:
+    """
+    管理系统探测函数：每个探测有独立的 TTL（秒，None 表示永不过期，0 表示不缓存），
+    结果按 (名称, 参数) 缓存；start_refresh() 启动后台线程在过期前主动刷新已用过的条目
+    """
+    def __init__(self):
+        self._probes = {}
+        self._values = {}
+        self._lock = threading.Lock()
+        self._stop = None
+        self._thread = None
+
+    def register(self, name, func, ttl=60.0):
+        """
+        注册（或替换）探测；func 无参数，或接受一个参数（如 getc 的盘符）
+        """
+        with self._lock:
+            self._probes[name] = (func, ttl)
+            for key in [k for k in self._values if k[0] == name]:
+                del self._values[key]
+
+    def unregister(self, name):
+        with self._lock:
+            self._probes.pop(name, None)
+            for key in [k for k in self._values if k[0] == name]:
+                del self._values[key]
+
+    def __contains__(self, name):
+        return name in self._probes
+
+    def get(self, name, arg=None):
+        """
+        返回探测结果；缓存未过期时只是一次字典查找
+        """
+        entry = self._values.get((name, arg))
+        if entry is not None and (entry[1] is None or time.monotonic() < entry[1]):
+            return entry[0]
+        return self._refresh((name, arg))
+
+    def invalidate(self, name=None):
+        """
+        丢弃缓存（name 为 None 时丢弃全部），下次 get 时重新探测
+        """
+        with self._lock:
+            if name is None:
+                self._values.clear()
+            else:
+                for key in [k for k in self._values if k[0] == name]:
+                    del self._values[key]
+
+    def _refresh(self, key):
+        name, arg = key
+        try:
+            func, ttl = self._probes[name]
+        except KeyError:
+            raise ValueError("未注册的探测: %s" % name) from None
+        value = func() if arg is None else func(arg)
+        if ttl != 0:
+            expires = None if ttl is None else time.monotonic() + ttl
+            with self._lock:
+                self._values[key] = (value, expires)
+        return value
+
+    def start_refresh(self, interval=1.0):
+        """
+        启动后台守护线程，每 interval 秒刷新即将过期的缓存条目，使渲染路径始终命中缓存
+        """
+        if self._thread is not None:
+            return
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._refresh_loop, args=(self._stop, interval),
+                                        name="probe-refresh", daemon=True)
+        self._thread.start()
+
+    def stop_refresh(self):
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+
+    def _refresh_loop(self, stop, interval):
+        while not stop.wait(interval):
+            deadline = time.monotonic() + interval
+            with self._lock:
+                due = [key for key, (_, expires) in self._values.items()
+                       if expires is not None and expires <= deadline]
+            for key in due:
+                try:
+                    self._refresh(key)
+                except Exception:
+                    # 后台刷新失败时保留旧值，等到前台调用时再暴露异常
+                    pass
+
+system_probes = ProbeRegistry()
+system_probes.register("winver", get_winver, ttl=None)
+system_probes.register("verx", get_verx, ttl=None)
+system_probes.register("getfps", lambda: str(get_fps()), ttl=1.0)
+system_probes.register("getc", getc, ttl=5.0)
+# hwid 随工作目录变化，不能按时间缓存（os.chdir 后会返回旧值）；哈希本身已按目录缓存
+system_probes.register("hwid", SystemInfo._compute_hwid, ttl=0)
+
+def register_probe(name, func, ttl=60.0):
+    """
+    注册自定义探测，之后即可在 printf 中以 "$名称" 使用（用户用 define_macro 定义的同名宏优先）
+    """
+    system_probes.register(name, func, ttl)
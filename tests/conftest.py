@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 直接在仓库根目录运行 pytest 时也能导入 PyFunLibs 包
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,103 @@
+import math
+import os
+import random
+import subprocess
+import sys
+
+import pytest
+
+from PyFunLibs.cli import benchmark_import, cli_main
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_module(*args, stdin=""):
+    return subprocess.run([sys.executable, "-m", "PyFunLibs"] + list(args), cwd=ROOT, input=stdin,
+                          stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+
+
+@pytest.mark.parametrize("options", [[], ["--algo", "radix"], ["--jobs", "2"], ["--memory-limit", "0.05"]])
+def test_sort_command(tmp_path, options):
+    rng = random.Random(1)
+    data = [rng.randint(-10 ** 9, 10 ** 9) for _ in range(5000)]
+    source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+    source.write_text(" ".join(map(str, data[:2500])) + "\n" + "\n".join(map(str, data[2500:])))
+    assert cli_main(["sort", "--input", str(source), "--output", str(target)] + options) == 0
+    assert [int(x) for x in target.read_text().split()] == sorted(data)
+
+
+def test_sort_floats_from_stdin():
+    result = run_module("sort", "--float", stdin="3.5 -1 2e3\n0.25\n")
+    assert result.returncode == 0
+    assert result.stdout.split() == ["-1.0", "0.25", "3.5", "2000.0"]
+
+
+def test_similarity_command(tmp_path):
+    pairs = tmp_path / "pairs.tsv"
+    pairs.write_text("kitten\tsitting\nabc\tabc\n")
+    target = tmp_path / "out.tsv"
+    assert cli_main(["similarity", "--pairs", str(pairs), "--output", str(target)]) == 0
+    assert target.read_text().splitlines() == ["kitten\tsitting\t3\t0.5714", "abc\tabc\t0\t1.0000"]
+    corpus = tmp_path / "corpus.txt"
+    corpus.write_text("hello\nhallo\nworld\n")
+    assert cli_main(["similarity", "--corpus", str(corpus), "--threshold", "0.7", "--output", str(target)]) == 0
+    assert target.read_text().splitlines() == ["0\t1\t0.8000"]
+
+
+def test_printf_and_math_commands():
+    result = run_module("printf", "--text", "hi $who", "--define", "who=there")
+    assert result.stdout == "hi there\n"
+    result = run_module("math", "--op", "sqrt", "--errors", "nan", stdin="4 -1\n9\n")
+    assert result.stdout.split() == ["2.0", "nan", "3.0"]
+    result = run_module("math", "--op", "sqrt", stdin="-4\n")
+    assert result.returncode == 2 and "负数无平方根" in result.stderr
+    result = run_module("math", "--op", "log_factorial", stdin="10\n")
+    assert float(result.stdout) == pytest.approx(math.lgamma(11))
+
+
+@pytest.fixture
+def digit_limit():
+    # 测试自身也要在大整数与字符串间转换；结束后恢复解释器原有的位数限制
+    if not hasattr(sys, "set_int_max_str_digits"):
+        pytest.skip("当前 Python 没有整数字符串位数限制")
+    saved = sys.get_int_max_str_digits()
+    yield sys.set_int_max_str_digits
+    sys.set_int_max_str_digits(saved)
+
+
+def test_math_factorial_beyond_int_string_limit(digit_limit):
+    digit_limit(0)
+    result = run_module("math", "--op", "factorial", stdin="5 3000\n")
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == ["120", str(math.factorial(3000))]
+
+
+def test_sort_integers_beyond_int_string_limit(tmp_path, digit_limit):
+    digit_limit(0)
+    big = [10 ** 5000 + 3, -(10 ** 5000), 7]
+    source, target = tmp_path / "in.txt", tmp_path / "out.txt"
+    source.write_text("\n".join(map(str, big)))
+    digit_limit(4300)
+    assert cli_main(["sort", "--input", str(source), "--output", str(target)]) == 0
+    # 进程内调用结束后恢复调用方的限制
+    assert sys.get_int_max_str_digits() == 4300
+    digit_limit(0)
+    assert [int(x) for x in target.read_text().split()] == sorted(big)
+
+
+def test_import_is_lazy():
+    report = benchmark_import("import PyFunLibs", repeat=1)
+    assert report['lazy_violations'] == []
+    assert not any(name.startswith("PyFunLibs.") for name in report['modules'])
+    report = benchmark_import("from PyFunLibs import printf, Sorter", repeat=1)
+    assert report['lazy_violations'] == []
+    assert "PyFunLibs.cli" not in report['modules']
+
+
+def test_package_exports_resolve():
+    import PyFunLibs
+    for name in PyFunLibs.__all__:
+        assert getattr(PyFunLibs, name) is not None
+    assert set(PyFunLibs.__all__) <= set(dir(PyFunLibs))
+    with pytest.raises(AttributeError):
+        PyFunLibs.no_such_name
@@ -0,0 +1,217 @@
+import asyncio
+import io
+import os
+import queue
+import subprocess
+import sys
+
+import pytest
+
+import PyFunLibs.io as pio
+from PyFunLibs.io import (AsyncConsole, ColorOutput, Colorizer, OutputSink, compile_format, define_macro, output,
+                          printf)
+from PyFunLibs.system import system_probes
+
+
+@pytest.fixture(autouse=True)
+def isolated_macros(monkeypatch):
+    monkeypatch.setattr(pio, "_macros", {})
+
+
+def test_printf_replaces_markers(capsys, monkeypatch):
+    monkeypatch.setattr(pio, "_render_builtin", lambda name: "<%s>" % name)
+    compile_format.cache_clear()
+    printf(r"a\ntb %winver %verx %getfps: $missing")
+    assert capsys.readouterr().out == "a\n b <winver> <verx> <getfps> $missing\n"
+    compile_format.cache_clear()
+
+
+def test_printf_macros_and_probes(capsys):
+    define_macro("name", "PyFunLibs")
+    system_probes.register("answer", lambda: 42, ttl=None)
+    try:
+        printf("$name says $answer")
+    finally:
+        system_probes.unregister("answer")
+    assert capsys.readouterr().out == "PyFunLibs says 42\n"
+
+
+def test_compile_format_is_cached_and_renders_lazily():
+    template = compile_format("plain text")
+    assert template is compile_format("plain text")
+    assert template.segments == ("plain text",)
+    assert compile_format("").render() == ""
+    calls = []
+    system_probes.register("counter", lambda: calls.append(1) or len(calls), ttl=0)
+    try:
+        template = compile_format("n=$counter")
+        assert not calls  # 编译时不读取探测
+        assert template.render() == "n=1"
+        assert template.render() == "n=2"
+    finally:
+        system_probes.unregister("counter")
+
+
+def test_output_sink_modes():
+    target = io.StringIO()
+    sink = OutputSink(target, mode='manual')
+    sink.write("a")
+    sink.write_line("b")
+    assert target.getvalue() == ""
+    sink.flush()
+    assert target.getvalue() == "ab\n"
+    sink.configure(mode='line')
+    sink.write("c")
+    assert target.getvalue() == "ab\n"
+    sink.write("\n")
+    assert target.getvalue() == "ab\nc\n"
+    sink.configure(mode='block', block_size=4, flush_interval=60)
+    sink.write("xyz")
+    assert target.getvalue() == "ab\nc\n"
+    sink.write("w")
+    assert target.getvalue() == "ab\nc\nxyzw"
+    with pytest.raises(ValueError):
+        sink.configure(mode='sometimes')
+
+
+def test_output_sink_keeps_partial_lines_per_thread():
+    import threading
+
+    target = io.StringIO()
+    sink = OutputSink(target)
+    sink.write("a")
+    worker = threading.Thread(target=sink.write_line, args=("b",))
+    worker.start()
+    worker.join()
+    assert target.getvalue() == "b\n"
+    sink.write_line("c")
+    assert target.getvalue() == "b\nac\n"
+    sink.write("prompt> ")
+    sink.flush()
+    assert target.getvalue() == "b\nac\nprompt> "
+
+
+def test_output_sink_block_mode_flushes_on_timer():
+    chunks = queue.Queue()
+    sink = OutputSink(chunks, mode='block', flush_interval=0.05)
+    sink.write_line("idle")
+    assert chunks.get(timeout=5) == "idle\n"
+
+
+def test_output_sink_buffered_restores_and_supports_queues():
+    target = io.StringIO()
+    sink = OutputSink(target)
+    q = queue.Queue()
+    with sink.buffered('manual', target=q):
+        sink.write_line("to queue")
+        assert q.empty()
+    assert q.get_nowait() == "to queue\n"
+    assert sink.mode == 'line'
+    sink.write_line("back")
+    assert target.getvalue() == "back\n"
+
+
+def test_buffered_output_collects_module_output():
+    chunks = []
+    with pio.buffered_output('manual', target=chunks.append):
+        output("one")
+        output("two")
+    assert chunks == ["one\ntwo\n"]
+
+
+def test_colored_text_and_colorizer():
+    reset = ColorOutput.COLORS['reset']
+    assert ColorOutput.colored_text("x", "red") == ColorOutput.COLORS['red'] + "x" + reset
+    assert ColorOutput.colored_text("x", 208) == "\033[38;5;208mx" + reset
+    assert ColorOutput.colored_text("x", "bold+#ff8800") == "\033[1;38;2;255;136;0mx" + reset
+    assert ColorOutput.colored_text("x", "bg:blue") == "\033[44mx" + reset
+    assert ColorOutput.colored_text("x", "nope") == reset + "x" + reset
+    plain = Colorizer(enabled=False)
+    assert list(plain.colorize([("a", "red")])) == ["a"]
+    assert list(plain.highlight(["ERROR x"], {"ERROR": "red"})) == ["ERROR x"]
+    painted = Colorizer(enabled=True)
+    assert list(painted.highlight(["ERROR and WARN"], [("ERROR", "red"), ("WARN", "yellow")])) == [
+        ColorOutput.COLORS['red'] + "ERROR" + reset + " and " + ColorOutput.COLORS['yellow'] + "WARN" + reset]
+    target = io.StringIO()
+    assert painted.write(painted.colorize([("a", "red"), ("b", "blue")]), file=target, batch=1) == 2
+    assert target.getvalue() == ColorOutput.COLORS['red'] + "a" + reset + ColorOutput.COLORS['blue'] + "b" + reset
+
+
+def test_colorizer_respects_no_color(monkeypatch):
+    class Tty(io.StringIO):
+        def isatty(self):
+            return True
+    assert Colorizer(stream=Tty()).enabled
+    monkeypatch.setenv("NO_COLOR", "1")
+    assert not Colorizer(stream=Tty()).enabled
+    assert not Colorizer(stream=io.StringIO()).enabled
+
+
+def test_async_console_over_streams():
+    async def session():
+        reader = asyncio.StreamReader()
+        reader.feed_data("first line\n".encode("utf-8"))
+        reader.feed_eof()
+        written = []
+
+        class Writer:
+            def write(self, data):
+                written.append(data.decode("utf-8"))
+
+            async def drain(self):
+                pass
+
+        console = AsyncConsole(reader, Writer())
+        line = await console.input("prompt> ")
+        await console.output(line.upper())
+        with pytest.raises(EOFError):
+            await console.input()
+        assert await console.run(sum, [1, 2, 3]) == 6
+        return "".join(written)
+
+    assert asyncio.run(session()) == "prompt> FIRST LINE\n"
+
+
+def test_async_output_not_blocked_by_pending_input(monkeypatch):
+    import threading
+
+    release = threading.Event()
+
+    class BlockingStdin:
+        def readline(self):
+            release.wait(10)
+            return "late\n"
+
+    chunks = []
+    monkeypatch.setattr(sys, "stdin", BlockingStdin())
+
+    async def session():
+        reading = asyncio.ensure_future(AsyncConsole().input())
+        await asyncio.sleep(0.05)
+        try:
+            await asyncio.wait_for(AsyncConsole().output("tick"), 2)
+        finally:
+            release.set()
+        return await reading
+
+    with pio.buffered_output('line', target=chunks.append):
+        assert asyncio.run(session()) == "late"
+    assert chunks == ["tick\n"]
+
+
+def test_async_input_leaves_stdin_usable():
+    if sys.platform.startswith("win"):
+        pytest.skip("fcntl 仅在 POSIX 系统可用")
+    script = (
+        "import asyncio, fcntl, os, sys\n"
+        "from PyFunLibs import async_user_input, user_input\n"
+        "print(asyncio.run(async_user_input()))\n"
+        "print(asyncio.run(async_user_input()))\n"
+        "print(user_input())\n"
+        "print(sys.stdin.closed, bool(fcntl.fcntl(0, fcntl.F_GETFL) & os.O_NONBLOCK))\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    result = subprocess.run([sys.executable, "-c", script], cwd=root, input="one\ntwo\nthree\n",
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    assert result.stdout.split("\n")[:4] == ["one", "two", "three", "False False"]
+    assert result.stderr == ""
@@ -0,0 +1,157 @@
+import math
+import random
+from array import array
+
+import pytest
+
+import PyFunLibs.math as pmath
+from PyFunLibs.math import Calculator, benchmark_trig
+
+
+def test_basic_operations():
+    assert Calculator.add(2, 3) == 5
+    assert Calculator.subtract(2, 3) == -1
+    assert Calculator.multiply(2, 3) == 6
+    assert Calculator.divide(3, 2) == 1.5
+    with pytest.raises(ValueError):
+        Calculator.divide(1, 0)
+    assert abs(Calculator.sqrt(2) - math.sqrt(2)) < 1e-9
+
+
+def test_power_matches_builtin():
+    rng = random.Random(1)
+    for _ in range(200):
+        a, b = rng.randint(-50, 50), rng.randint(0, 60)
+        assert Calculator.power(a, b) == a ** b
+    assert Calculator.power(2, -3) == 0.125
+    assert Calculator.power(2.0, 10.0) == 1024
+    assert abs(Calculator.power(2, 0.5) - math.sqrt(2)) < 1e-12
+    with pytest.raises(ValueError):
+        Calculator.power(-8, 1 / 3)
+    with pytest.raises(ValueError):
+        Calculator.power(0, -1)
+
+
+def test_modular_power_matches_builtin_pow():
+    rng = random.Random(2)
+    for _ in range(200):
+        a, b, m = rng.randint(-10 ** 6, 10 ** 6), rng.randint(0, 10 ** 6), rng.randint(1, 10 ** 9)
+        m = m if rng.random() < 0.8 else -m
+        assert Calculator.power(a, b, m) == pow(a, b, m)
+    assert Calculator.power(3, -1, 7) == pow(3, -1, 7)
+    with pytest.raises(ValueError):
+        Calculator.power(2, -1, 4)
+    with pytest.raises(ValueError):
+        Calculator.power(2, 3, 0)
+
+
+@pytest.mark.parametrize("scale", [1.0, 1e3, 1e6, 1e15, 1e300])
+def test_sin_cos_match_math(scale):
+    rng = random.Random(3)
+    for _ in range(300):
+        x = rng.uniform(-scale, scale)
+        assert abs(Calculator.sin(x) - math.sin(x)) < 1e-15 * 4
+        assert abs(Calculator.cos(x) - math.cos(x)) < 1e-15 * 4
+        s, c = Calculator.sincos(x)
+        assert (s, c) == (Calculator.sin(x), Calculator.cos(x))
+
+
+def test_trig_batch_and_special_values():
+    values = [0.0, math.pi / 2, math.pi, -1.0, 10.0]
+    assert list(Calculator.sin_many(values)) == [Calculator.sin(x) for x in values]
+    out = array('d', bytes(8 * len(values)))
+    assert Calculator.cos_many(values, out=out) is out
+    assert list(out) == [Calculator.cos(x) for x in values]
+    assert math.isnan(Calculator.sin(float('nan')))
+    with pytest.raises(ValueError):
+        Calculator.cos(float('inf'))
+
+
+def test_factorial_matches_math_across_cache():
+    for n in [0, 1, 5, 63, 64, 100, 1000, 1100, 950, 1000, 3000]:
+        assert Calculator.factorial(n) == math.factorial(n)
+    with pytest.raises(ValueError):
+        Calculator.factorial(-1)
+
+
+def test_factorial_cache_is_thread_safe():
+    from concurrent.futures import ThreadPoolExecutor
+    expected = {n: math.factorial(n) for n in range(64, 400)}
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(Calculator.factorial, list(expected) * 4))
+    assert results == list(expected.values()) * 4
+
+
+def test_binomial_and_log_factorial():
+    for n in range(0, 120, 7):
+        for k in range(0, n + 3, 5):
+            assert Calculator.binomial(n, k) == math.comb(n, k)
+    for n in [0, 1, 10, 63, 64, 500, 10 ** 6, 2.5]:
+        assert abs(Calculator.log_factorial(n) - math.lgamma(n + 1)) <= 1e-12 * max(1.0, math.lgamma(n + 1))
+
+
+def test_elementwise_batch_operations():
+    a = [1.0, 2.0, 3.0]
+    assert list(Calculator.add_many(a, 1)) == [2.0, 3.0, 4.0]
+    assert list(Calculator.subtract_many(a, array('d', [1, 1, 1]))) == [0.0, 1.0, 2.0]
+    assert list(Calculator.multiply_many(2, a)) == [2.0, 4.0, 6.0]
+    with pytest.raises(ValueError):
+        Calculator.add_many([1, 2], [1, 2, 3])
+    with pytest.raises(ValueError):
+        Calculator.divide_many(a, [1, 0, 1])
+    result = Calculator.divide_many(a, [1, 0, 2], errors='nan')
+    assert result[0] == 1.0 and math.isnan(result[1]) and result[2] == 1.5
+    values, mask = Calculator.sqrt_many([4, -1, 9], errors='mask')
+    assert list(mask) == [0, 1, 0] and values[0] == 2.0 and values[2] == 3.0
+    with pytest.raises(ValueError):
+        Calculator.sqrt_many([1], errors='ignore')
+
+
+@pytest.fixture(params=['python', 'numpy'])
+def elementwise_backend(request, monkeypatch):
+    # 同一组断言分别在纯 Python 路径与 numpy 路径上运行
+    if request.param == 'numpy':
+        monkeypatch.setattr(pmath, "_numpy_module", pytest.importorskip("numpy"))
+    else:
+        monkeypatch.setattr(pmath, "_numpy_module", False)
+    return request.param
+
+
+def test_elementwise_backends_agree(elementwise_backend):
+    out = array('d', bytes(8 * 3))
+    assert Calculator.add_many([1, 2, 3], 0.5, out=out) is out
+    assert list(out) == [1.5, 2.5, 3.5]
+    values, mask = Calculator.divide_many([1.0, 2.0, 3.0], [1, 0, 2], errors='mask')
+    assert type(values) is array and type(mask) is array and mask.typecode == 'B'
+    assert list(mask) == [0, 1, 0] and math.isnan(values[1])
+    with pytest.raises(ValueError):
+        Calculator.add_many(1, 2, out=array('d', [0.0]))
+    with pytest.raises(ValueError):
+        Calculator.sqrt_many(4.0, out=array('d', [0.0]))
+    with pytest.raises(ValueError):
+        Calculator.multiply_many([1, 2, 3], 2, out=array('d', [0.0]))
+    with pytest.raises(ValueError):
+        Calculator.sqrt_many([1, -1])
+
+
+def test_elementwise_numpy_arrays():
+    np = pytest.importorskip("numpy")
+    xs = np.array([[4.0, -1.0], [9.0, 16.0]])
+    values, mask = Calculator.sqrt_many(xs, errors='mask')
+    assert isinstance(values, np.ndarray) and values.shape == (2, 2)
+    assert type(mask) is array and list(mask) == [0, 1, 0, 0]
+    assert list(Calculator.add_many(np.arange(3.0), [1, 1, 1])) == [1.0, 2.0, 3.0]
+    out = np.zeros(3)
+    assert Calculator.multiply_many([1, 2, 3], 2, out=out) is out
+    assert out.tolist() == [2.0, 4.0, 6.0]
+    with pytest.raises(ValueError):
+        Calculator.add_many(np.arange(3.0), np.arange(2.0))
+    with pytest.raises(ValueError):
+        Calculator.add_many([1, 2], [3, 4], out=np.zeros(1))
+    with pytest.raises(ValueError, match="位置 1"):
+        Calculator.divide_many(np.ones(3), np.array([1.0, 0.0, 2.0]))
+
+
+def test_benchmark_trig_accuracy():
+    report = benchmark_trig(2000, seed=1)
+    assert all(row['max_abs_error'] < 1e-14 for row in report.values())
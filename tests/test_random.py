@@ -0,0 +1,194 @@
+import math
+from array import array
+from collections import Counter
+
+import pytest
+
+import PyFunLibs.random as prandom
+from PyFunLibs.random import (RNG_BACKENDS, PCG64Generator, RandomGenerator, SplitMix64Generator,
+                              WeightedSampler, Xoshiro256Generator, benchmark_rng)
+
+BACKENDS = sorted(RNG_BACKENDS)
+
+
+def test_lcg_sequence_is_unchanged():
+    # 与旧版线性同余实现逐项一致
+    rng = RandomGenerator(42)
+    seed = 42
+    for _ in range(100):
+        seed = (1103515245 * seed + 12345) & 0x7FFFFFFF
+        assert rng.random() == seed / 0x80000000
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_same_seed_same_stream(backend):
+    a = RandomGenerator.create(backend, 123)
+    b = RandomGenerator.create(backend, 123)
+    assert [a.random() for _ in range(50)] == [b.random() for _ in range(50)]
+    values = [a.random() for _ in range(1000)]
+    assert all(0.0 <= v < 1.0 for v in values)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("steps", [0, 1, 255, 256, 1000, 4097])
+def test_advance_matches_stepping(backend, steps):
+    stepped = RandomGenerator.create(backend, 7)
+    for _ in range(steps):
+        stepped._next()
+    jumped = RandomGenerator.create(backend, 7).advance(steps)
+    assert [jumped._next() for _ in range(20)] == [stepped._next() for _ in range(20)]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_jump_keeps_original_and_splits_stream(backend):
+    rng = RandomGenerator.create(backend, 9)
+    block = 300
+    workers = [rng.jump(i * block) for i in range(3)]
+    joined = [x for w in workers for x in (w.random() for _ in range(block))]
+    assert joined == [rng.random() for _ in range(3 * block)]
+
+
+def xoshiro_reference_jump(gen):
+    # 参考实现 xoshiro256** 的 jump()：前进 2^128 步
+    constants = (0x180EC6D33CFD0ABA, 0xD5A61266F0C9392C, 0xA9582618E03FC9AA, 0x39ABDC4529B1661C)
+    acc = [0, 0, 0, 0]
+    for word in constants:
+        for bit in range(64):
+            if word >> bit & 1:
+                acc = [a ^ s for a, s in zip(acc, gen._s)]
+            gen._next()
+    gen._s = tuple(acc)
+
+
+def test_xoshiro_spawn_matches_reference_jump():
+    rng = Xoshiro256Generator(2024)
+    reference = Xoshiro256Generator(2024)
+    children = rng.spawn(3)
+    for child in children:
+        assert child._s == reference._s
+        xoshiro_reference_jump(reference)
+    assert rng._s == reference._s
+
+
+def test_splitmix64_reference_values():
+    # SplitMix64 参考实现在种子 0 下的前几项输出
+    rng = SplitMix64Generator(0)
+    assert [rng._next() for _ in range(3)] == [0xE220A8397B1DCDAF, 0x6E789E6AA1B965F4, 0x06C45D188009454F]
+
+
+def test_pcg64_streams_differ():
+    a, b = PCG64Generator(1, stream=0), PCG64Generator(1, stream=1)
+    assert [a._next() for _ in range(5)] != [b._next() for _ in range(5)]
+    children = PCG64Generator(3).spawn(2)
+    assert children[0].random() != children[1].random()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_randbelow_and_randint_bounds(backend):
+    rng = RandomGenerator.create(backend, 11)
+    for n in (1, 2, 3, 7, 1000, 2 ** 40 + 3, 2 ** 100):
+        assert all(0 <= rng.randbelow(n) < n for _ in range(200))
+    counts = Counter(rng.randint(1, 6) for _ in range(6000))
+    assert set(counts) == {1, 2, 3, 4, 5, 6}
+    assert all(800 < c < 1200 for c in counts.values())
+    assert 0 <= rng.getrandbits(200) < 2 ** 200
+    with pytest.raises(ValueError):
+        rng.randbelow(0)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_bulk_output_matches_scalar(backend):
+    rng = RandomGenerator.create(backend, 13)
+    twin = RandomGenerator.create(backend, 13)
+    bulk = rng.random_array(100)
+    assert list(bulk) == [twin.random() for _ in range(100)]
+    buffer = array('d', bytes(8 * 100))
+    assert RandomGenerator.create(backend, 13).random_array(100, out=buffer) is buffer
+    assert list(buffer) == list(bulk)
+    ints = rng.randint_array(500, -3, 3)
+    assert min(ints) >= -3 and max(ints) <= 3
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_bulk_output_spans_blocks_with_bounded_memory(backend, monkeypatch):
+    import tracemalloc
+
+    monkeypatch.setattr(prandom, "_FILL_BLOCK", 1024)
+    n = 60000
+    twin = RandomGenerator.create(backend, 21)
+    expected = [twin.random() for _ in range(n)]
+    buffer = bytearray(8 * n)
+    tracemalloc.start()
+    try:
+        RandomGenerator.create(backend, 21).random_array(n, out=buffer)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert memoryview(buffer).cast('d').tolist() == expected
+    # 按块写入：峰值只与块大小有关，远小于整个结果（480KB）
+    assert peak < 8 * n // 2
+    rng = RandomGenerator.create(backend, 21)
+    with pytest.raises(ValueError):
+        rng.randint_array(10, 0, 9, out=[0] * 9)
+    assert rng.random() == expected[0]
+
+
+def test_sampling_helpers():
+    rng = RandomGenerator.create('xoshiro256**', 17)
+    seq = list(range(20))
+    assert rng.choice(seq) in seq
+    with pytest.raises(IndexError):
+        rng.choice([])
+    shuffled = list(seq)
+    rng.shuffle(shuffled)
+    assert sorted(shuffled) == seq
+    for k in (0, 3, 15, 20):
+        picked = rng.sample(seq, k)
+        assert len(picked) == len(set(picked)) == k and set(picked) <= set(seq)
+    with pytest.raises(ValueError):
+        rng.sample(seq, 21)
+
+
+def test_weighted_choices_follow_weights():
+    rng = RandomGenerator.create('pcg64', 19)
+    counts = Counter(rng.choices("abc", weights=[1, 2, 7], k=20000))
+    assert abs(counts['a'] / 20000 - 0.1) < 0.015
+    assert abs(counts['c'] / 20000 - 0.7) < 0.015
+    assert set(rng.choices("abc", weights=[0, 1, 0], k=50)) == {'b'}
+    with pytest.raises(ValueError):
+        rng.choices("abc", weights=[1, 2])
+    with pytest.raises(ValueError):
+        rng.choices("ab", weights=[0, 0])
+
+
+def test_weighted_sampler_is_reusable():
+    rng = RandomGenerator.create('xoshiro256**', 21)
+    twin = RandomGenerator.create('xoshiro256**', 21)
+    sampler = rng.weighted_sampler([5, 1, 4], population="xyz")
+    assert isinstance(sampler, WeightedSampler) and len(sampler) == 3
+    # 与 choices 消耗同样的随机数，结果逐项一致
+    assert [x for _ in range(100) for x in sampler(3)] == twin.choices("xyz", weights=[5, 1, 4], k=300)
+    indices = RandomGenerator.create('pcg64', 1).weighted_sampler([0, 0, 3])(20)
+    assert indices == [2] * 20
+    with pytest.raises(ValueError):
+        rng.weighted_sampler([1, 2], population="xyz")
+    with pytest.raises(IndexError):
+        rng.weighted_sampler([])
+
+
+def test_reservoir_sample_is_uniform():
+    rng = RandomGenerator.create('splitmix64', 23)
+    assert rng.reservoir_sample(range(3), 5) == [0, 1, 2]
+    counts = Counter()
+    for _ in range(2000):
+        sample = rng.reservoir_sample(iter(range(50)), 5)
+        assert len(set(sample)) == 5
+        counts.update(sample)
+    expected = 2000 * 5 / 50
+    assert all(abs(c - expected) < 4 * math.sqrt(expected) for c in counts.values())
+
+
+def test_benchmark_rng_reports_all_backends():
+    report = benchmark_rng(2000, seed=1)
+    assert set(report) == set(RNG_BACKENDS) | {'stdlib'}
+    assert all(row['random'] > 0 for row in report.values())
@@ -0,0 +1,198 @@
+import random
+
+import pytest
+
+from PyFunLibs.sorting import (SORT_ALGORITHMS, SORT_DISTRIBUTIONS, BinaryHeap, ExternalSorter, PriorityQueue,
+                               Sorter, benchmark_sorter, make_distribution)
+
+COMPARISON_SORTS = [name for name in SORT_ALGORITHMS if name not in ('counting', 'radix')]
+
+
+def inputs():
+    rng = random.Random(4)
+    yield []
+    yield [1]
+    yield [2, 1]
+    yield [rng.randint(-50, 50) for _ in range(300)]          # 大量重复
+    yield [rng.random() - 0.5 for _ in range(300)]
+    yield list(range(200))
+    yield list(range(200, 0, -1))
+    yield [7] * 100
+    yield list(range(100)) + list(range(100, 0, -1))          # organ pipe
+    yield [rng.randint(-10 ** 12, 10 ** 12) for _ in range(500)]
+
+
+@pytest.mark.parametrize("name", COMPARISON_SORTS + ['reverse'])
+def test_sorters_match_sorted(name):
+    func = getattr(Sorter, name)
+    for data in inputs():
+        original = list(data)
+        expected = data[::-1] if name == 'reverse' else sorted(data)
+        assert func(data) == expected
+        assert data == original  # 输入不被修改
+
+
+@pytest.mark.parametrize("dist", SORT_DISTRIBUTIONS)
+def test_quick_introsort_auto_on_distributions(dist):
+    data = make_distribution(dist, 3000, seed=1)
+    expected = sorted(data)
+    for name in ('quick', 'introsort', 'auto'):
+        assert getattr(Sorter, name)(data) == expected
+
+
+def test_quick_three_way_partition_handles_duplicates():
+    rng = random.Random(5)
+    data = [rng.randint(0, 2) for _ in range(20000)]
+    assert Sorter.quick(data) == sorted(data)
+
+
+def test_quick_allocates_only_the_output_copy():
+    import sys
+    import tracemalloc
+
+    data = make_distribution('few_unique', 50000, seed=2)
+    tracemalloc.start()
+    try:
+        Sorter.quick(data)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    # 相等元素逐个换回中间，峰值只比输出副本多出显式栈
+    assert peak < sys.getsizeof(data[:]) * 1.05
+
+
+def test_introsort_strings_and_tuples():
+    rng = random.Random(6)
+    words = ["".join(rng.choice("xyz") for _ in range(rng.randint(0, 5))) for _ in range(400)]
+    assert Sorter.introsort(words) == sorted(words)
+    pairs = [(rng.randint(0, 5), rng.random()) for _ in range(400)]
+    assert Sorter.auto(pairs) == sorted(pairs)
+
+
+@pytest.mark.parametrize("name", ['counting', 'radix'])
+def test_integer_sorts(name):
+    func = getattr(Sorter, name)
+    rng = random.Random(7)
+    for data in ([rng.randint(-1000, 1000) for _ in range(2000)],
+                 [rng.randint(-2 ** 70, 2 ** 70) for _ in range(2000)],
+                 [rng.randint(0, 3) for _ in range(70000)]):
+        assert func(data) == sorted(data)
+
+
+def test_radix_floats_and_keys_are_stable():
+    rng = random.Random(8)
+    floats = [rng.uniform(-1e6, 1e6) for _ in range(1000)] + [0.0, -0.0, float('inf'), float('-inf')]
+    assert Sorter.radix(floats) == sorted(floats)
+    records = [(rng.randint(-5, 5), i) for i in range(500)]
+    assert Sorter.radix(records, key=lambda r: r[0]) == sorted(records, key=lambda r: r[0])
+    assert Sorter.counting(records, key=lambda r: r[0]) == sorted(records, key=lambda r: r[0])
+    scored = [(rng.choice([0.5, -1.25, 3.0]), i) for i in range(300)]
+    assert Sorter.radix(scored, key=lambda r: r[0]) == sorted(scored, key=lambda r: r[0])
+    with pytest.raises(TypeError):
+        Sorter.radix(["a", "b"])
+
+
+@pytest.mark.parametrize("name", ['counting', 'radix'])
+def test_mixed_int_float_keys_keep_exact_order(name):
+    func = getattr(Sorter, name)
+    assert func([2 ** 53 + 1, float(2 ** 53), 2 ** 53]) == [2 ** 53, float(2 ** 53), 2 ** 53 + 1]
+    huge = [10 ** 400, 0.5, -(10 ** 400), 3, float('inf')]
+    assert func(huge) == sorted(huge)
+    small = [3, 1.5, -2, 0.25, 2 ** 53]
+    assert func(small) == sorted(small)
+    records = [(2 ** 60 + i % 3, i) for i in range(30)] + [(1.5, 30), (2.0 ** 60, 31)]
+    assert func(records, key=lambda r: r[0]) == sorted(records, key=lambda r: r[0])
+
+
+def test_parallel_merge_uses_workers():
+    rng = random.Random(9)
+    ints = [rng.randint(-10 ** 9, 10 ** 9) for _ in range(20000)]
+    assert Sorter.parallel_merge(ints, jobs=2, min_chunk=1000) == sorted(ints)
+    words = [str(x) for x in ints[:5000]]
+    assert Sorter.parallel_merge(words, jobs=2, min_chunk=1000) == sorted(words)
+
+
+def test_top_k_and_select():
+    rng = random.Random(10)
+    data = [rng.randint(0, 100) for _ in range(1000)]
+    assert Sorter.top_k(data, 10) == sorted(data)[:10]
+    assert Sorter.top_k(data, 10, reverse=True) == sorted(data, reverse=True)[:10]
+    assert Sorter.top_k(iter(data), 0) == []
+    records = [(x, i) for i, x in enumerate(data)]
+    assert Sorter.top_k(records, 5, key=lambda r: r[0]) == sorted(records, key=lambda r: r[0])[:5]
+    ordered = sorted(data)
+    for k in (0, 1, 500, 999):
+        assert Sorter.select(data, k) == ordered[k]
+    with pytest.raises(IndexError):
+        Sorter.select(data, 1000)
+
+
+def test_binary_heap():
+    rng = random.Random(11)
+    data = [rng.randint(0, 1000) for _ in range(300)]
+    heap = BinaryHeap(data)
+    assert [heap.pop() for _ in range(len(data))] == sorted(data)
+    heap = BinaryHeap(reverse=True)
+    for x in data:
+        heap.push(x)
+    assert heap.peek() == max(data)
+    assert heap.replace(-1) == max(data)
+    assert heap.pushpop(10 ** 6) == 10 ** 6
+    with pytest.raises(IndexError):
+        BinaryHeap().peek()
+
+
+def test_priority_queue_updates():
+    queue = PriorityQueue()
+    for item, priority in [("a", 5), ("b", 3), ("c", 8), ("d", 1)]:
+        queue.push(item, priority)
+    queue.decrease_key("c", 0)
+    queue.update("d", 9)
+    queue.remove("b")
+    assert "b" not in queue
+    assert queue.priority("a") == 5
+    assert [queue.pop() for _ in range(len(queue))] == [("c", 0), ("a", 5), ("d", 9)]
+    queue.push("x", 1)
+    with pytest.raises(ValueError):
+        queue.push("x", 2)
+    with pytest.raises(ValueError):
+        queue.decrease_key("x", 3)
+
+
+def test_external_sorter_spills_and_merges(tmp_path):
+    rng = random.Random(12)
+    data = [rng.randint(-10 ** 6, 10 ** 6) for _ in range(20000)]
+    source = tmp_path / "in.txt"
+    source.write_text("\n".join(map(str, data)) + "\n")
+    sorter = ExternalSorter(memory_limit=20000, fan_in=4, parse=int, tmp_dir=str(tmp_path))
+    assert list(sorter.sort(str(source))) == sorted(data)
+    out = tmp_path / "out.txt"
+    assert sorter.sort_to_file(data, str(out)) == len(data)
+    assert [int(line) for line in out.read_text().split()] == sorted(data)
+    # 临时有序段全部清理
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["in.txt", "out.txt"]
+
+
+def test_external_sorter_is_stable_with_key():
+    records = [(i % 7, i) for i in range(3000)]
+    sorter = ExternalSorter(memory_limit=5000, key=lambda r: r[0])
+    assert list(sorter.sort(records)) == sorted(records, key=lambda r: r[0])
+
+
+def test_make_distribution_is_reproducible():
+    for dist in SORT_DISTRIBUTIONS:
+        assert make_distribution(dist, 500, seed=3) == make_distribution(dist, 500, seed=3)
+        assert len(make_distribution(dist, 500)) == 500
+    with pytest.raises(ValueError):
+        make_distribution("zigzag", 10)
+
+
+def test_benchmark_sorter_reports_correctness():
+    report = benchmark_sorter(sizes=[200], distributions=['random', 'sorted'], algorithms=['merge', 'auto'],
+                              repeat=1)
+    entries = [e for e in report['results'] if e['algorithm'] != 'sorted']
+    assert len(entries) == 4
+    assert all(e['correct'] for e in entries)
+    assert all(e['comparisons'] > 0 for e in entries if e['algorithm'] == 'merge')
+    # auto 对整数会选非比较排序，计数包装会改变它的路径，因此不报告比较次数
+    assert all(e['comparisons'] is None for e in entries if e['algorithm'] == 'auto')
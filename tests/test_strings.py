@@ -0,0 +1,121 @@
+import random
+
+import pytest
+
+from PyFunLibs.strings import (FuzzyIndex, check_length, dedup_clusters, levenshtein_distance,
+                               similarity_pairs, similarity_ratio)
+
+
+def reference_distance(s1, s2):
+    # 教科书式的完整 DP 矩阵，作为位并行实现的参照
+    rows = [[0] * (len(s2) + 1) for _ in range(len(s1) + 1)]
+    for i in range(len(s1) + 1):
+        rows[i][0] = i
+    for j in range(len(s2) + 1):
+        rows[0][j] = j
+    for i in range(1, len(s1) + 1):
+        for j in range(1, len(s2) + 1):
+            cost = 0 if s1[i - 1] == s2[j - 1] else 1
+            rows[i][j] = min(rows[i - 1][j] + 1, rows[i][j - 1] + 1, rows[i - 1][j - 1] + cost)
+    return rows[-1][-1]
+
+
+def random_strings(rng, count, alphabet="abcd", max_len=20):
+    return ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, max_len))) for _ in range(count)]
+
+
+def test_check_length():
+    assert check_length("abc") == 3
+    assert check_length([1, 2]) == 2
+
+
+@pytest.mark.parametrize("max_len", [8, 70, 150])
+def test_levenshtein_matches_reference(max_len):
+    rng = random.Random(max_len)
+    words = random_strings(rng, 60, max_len=max_len)
+    for s1, s2 in zip(words, words[1:]):
+        assert levenshtein_distance(s1, s2) == reference_distance(s1, s2)
+
+
+def test_levenshtein_unicode_and_unhashable():
+    assert levenshtein_distance("kitten", "sitting") == 3
+    assert levenshtein_distance("汉字测试", "汉语测验") == 2
+    # 元素不可哈希时退回两行 DP
+    assert levenshtein_distance([[1], [2], [3]], [[1], [3]]) == 1
+
+
+def test_levenshtein_max_distance_cutoff():
+    rng = random.Random(1)
+    words = random_strings(rng, 80, max_len=30)
+    for s1, s2 in zip(words, words[1:]):
+        exact = reference_distance(s1, s2)
+        for limit in (0, 2, 5):
+            expected = exact if exact <= limit else limit + 1
+            assert levenshtein_distance(s1, s2, limit) == expected
+    with pytest.raises(ValueError):
+        levenshtein_distance("a", "b", -1)
+
+
+def test_similarity_ratio():
+    assert similarity_ratio("", "") == 1.0
+    assert similarity_ratio("abcd", "abcf") == 0.75
+    assert similarity_ratio("abcd", "wxyz", min_ratio=0.5) == 0.0
+    assert similarity_ratio("abcd", "abcf", min_ratio=0.75) == 0.75
+
+
+def test_fuzzy_index_matches_brute_force():
+    rng = random.Random(2)
+    words = sorted(set(random_strings(rng, 300, max_len=8)))
+    index = FuzzyIndex(words)
+    assert len(index) == len(words)
+    for query in random_strings(rng, 20, max_len=8):
+        distances = {w: reference_distance(query, w) for w in words}
+        within = index.within(query, 2)
+        assert sorted(within) == sorted((w, d) for w, d in distances.items() if d <= 2)
+        assert [d for _, d in within] == sorted(d for _, d in within)
+        nearest = index.nearest(query, k=5)
+        assert [d for _, d in nearest] == sorted(distances.values())[:5]
+        assert all(distances[w] == d for w, d in nearest)
+
+
+def test_fuzzy_index_remove_and_persist(tmp_path):
+    index = FuzzyIndex(["apple", "apply", "ample", "maple"])
+    assert not index.add("apple")
+    assert index.remove("apply")
+    assert not index.remove("apply")
+    assert "apply" not in index
+    assert [w for w, _ in index.within("apply", 1)] == ["apple"]
+    path = tmp_path / "index.bin"
+    index.save(str(path))
+    loaded = FuzzyIndex.load(str(path))
+    assert sorted(loaded) == sorted(index)
+    assert loaded.nearest("mapel", 1) == index.nearest("mapel", 1)
+
+
+def brute_pairs(corpus, threshold):
+    result = set()
+    for i in range(len(corpus)):
+        for j in range(i + 1, len(corpus)):
+            ratio = similarity_ratio(corpus[i], corpus[j])
+            if ratio >= threshold:
+                result.add((i, j))
+    return result
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.8, 1.0])
+def test_similarity_pairs_matches_brute_force(threshold):
+    rng = random.Random(3)
+    corpus = random_strings(rng, 120, alphabet="ab", max_len=10)
+    found = {(i, j) for i, j, _ in similarity_pairs(corpus, threshold, jobs=1, chunk_size=7)}
+    assert found == brute_pairs(corpus, threshold)
+
+
+def test_similarity_pairs_process_pool():
+    corpus = ["hello", "hallo", "world", "word", "hello"]
+    found = sorted(similarity_pairs(corpus, 0.7, jobs=2, chunk_size=1))
+    assert found == sorted(similarity_pairs(corpus, 0.7, jobs=1))
+
+
+def test_dedup_clusters():
+    corpus = ["color", "colour", "banana", "colr", "bananas", "kiwi"]
+    assert dedup_clusters(corpus, 0.7, jobs=1) == [[0, 1, 3], [2, 4]]
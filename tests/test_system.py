@@ -0,0 +1,96 @@
+import asyncio
+import time
+
+import pytest
+
+from PyFunLibs.system import (ProbeRegistry, SystemInfo, async_delay, calibrate_delay, delay, delay_until, get_verx,
+                              getc, system_probes)
+
+
+def test_hwid_is_stable_and_cached():
+    assert SystemInfo.get_hwid() == SystemInfo.get_hwid() == SystemInfo._compute_hwid()
+    assert SystemInfo.get_hwid().startswith("0x")
+    assert "cookie1" in SystemInfo.get_cookies()
+
+
+def test_hwid_follows_working_directory(tmp_path, monkeypatch):
+    before = SystemInfo.get_hwid()
+    monkeypatch.chdir(tmp_path)
+    after = SystemInfo.get_hwid()
+    assert after != before
+    assert after == SystemInfo._compute_hwid()
+
+
+def test_probes_report_values():
+    assert get_verx() in ("32bit", "64bit")
+    free = getc("/")
+    assert free.endswith("G")
+    assert getc("C:") == free  # 非 Windows 系统上盘符映射到根目录
+    assert system_probes.get("getc", "/") == free
+
+
+def test_probe_registry_ttl_and_invalidate():
+    registry = ProbeRegistry()
+    calls = []
+    registry.register("n", lambda: len(calls) or calls.append(1) or len(calls), ttl=None)
+    registry.register("short", lambda: time.monotonic(), ttl=0.05)
+    registry.register("uncached", lambda: object(), ttl=0)
+    assert registry.get("n") == registry.get("n") == 1
+    registry.invalidate("n")
+    assert registry.get("n") == 1 and len(calls) == 1
+    first = registry.get("short")
+    assert registry.get("short") == first
+    time.sleep(0.06)
+    assert registry.get("short") != first
+    assert registry.get("uncached") is not registry.get("uncached")
+    registry.unregister("n")
+    assert "n" not in registry
+    with pytest.raises(ValueError):
+        registry.get("n")
+
+
+def test_probe_registry_background_refresh():
+    registry = ProbeRegistry()
+    calls = []
+    registry.register("tick", lambda: calls.append(1) or len(calls), ttl=0.05)
+    registry.get("tick")
+    registry.start_refresh(interval=0.02)
+    try:
+        time.sleep(0.3)
+    finally:
+        registry.stop_refresh()
+    assert len(calls) > 2
+
+
+def test_delay_precision():
+    calibrate_delay(5)
+    start = time.perf_counter()
+    delay(0.02)
+    elapsed = time.perf_counter() - start
+    assert 0.02 <= elapsed < 0.05
+    deadline = time.perf_counter() + 0.01
+    delay_until(deadline)
+    assert time.perf_counter() >= deadline
+    delay(0)
+    delay(-1)
+
+
+def test_async_delay():
+    async def run():
+        start = time.perf_counter()
+        await async_delay(0.02)
+        return time.perf_counter() - start
+    assert 0.02 <= asyncio.run(run()) < 0.1
+
+
+def test_async_delay_spins_briefly(monkeypatch):
+    import PyFunLibs.system as psystem
+
+    # 同步窗口被放大到上限时，协程版本仍只在最后约 2 毫秒内让出循环逼近
+    monkeypatch.setattr(psystem, "_spin_window", psystem._SPIN_MAX)
+
+    async def run():
+        start = time.process_time()
+        await async_delay(0.05)
+        return time.process_time() - start
+    assert asyncio.run(run()) < psystem._SPIN_MAX * 0.75